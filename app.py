@@ -1,17 +1,15 @@
 from flask import Flask, render_template, request, jsonify, render_template_string
 from datetime import datetime, timezone
 import pytz
-from professional_astro import ProfessionalAstrologyEngine
+from professional_astro import ProfessionalAstrologyEngine, ENHANCED_ENGINE_AVAILABLE
 
 # Import precision validation framework
 from precision_validation import PrecisionValidationFramework, validate_astrology_app, get_app_health_status
 
-# Import our enhanced engine
-try:
+# Reuse professional_astro's import probe for our enhanced engine
+if ENHANCED_ENGINE_AVAILABLE:
     from engines.base_engine import EnhancedBaseEngine
-    ENHANCED_ENGINE_AVAILABLE = True
-except ImportError:
-    ENHANCED_ENGINE_AVAILABLE = False
+else:
     print("Enhanced engine not available - using standard calculations")
 
 app = Flask(__name__)
@@ -25,11 +23,11 @@ def initialize_validation():
     try:
         # Try to connect with professional calculator
         calc = ProfessionalAstrologyEngine()
-        validation_framework = PrecisionValidationFramework(calc)
+        validation_framework = PrecisionValidationFramework(calc, verbose=False)
         print("Validation framework initialized with professional calculator")
     except Exception as e:
         # Fallback to basic validation
-        validation_framework = PrecisionValidationFramework()
+        validation_framework = PrecisionValidationFramework(verbose=False)
         print(f"Validation framework initialized without calculator: {e}")
 
 # Initialize validation on startup
@@ -442,7 +440,7 @@ def calculate_enhanced_chart():
         lat, lon, location_name = basic_calc.get_coordinates_for_city(birth_city or "London")
         
         engine = EnhancedBaseEngine({'precision': 'HIGH'})
-        jd = engine.precise_julian_day(birth_datetime.replace(tzinfo=timezone.utc))
+        jd = engine.precise_julian_day(birth_datetime)
         
         sun_tropical = engine.enhanced_sun_longitude(jd)
         moon_tropical = engine.enhanced_moon_longitude(jd)
@@ -642,7 +640,7 @@ def api_calculate():
             'house_system': house_system
         })
 
-        return jsonify(result), 200
+        return app.response_class(calc.to_json(result), mimetype='application/json'), 200
 
     except Exception as e:
         return jsonify({'error': str(e)}), 400
@@ -764,14 +762,99 @@ def api_full_report():
         predictions = calc.get_transit_predictions(chart, prediction_date)
         predictions_html = _mk_predictions_html(predictions, prediction_date.strftime('%Y-%m-%d'))
 
-        return jsonify({
+        report = {
             'ok': True,
             'report': {
                 'chart': chart,
                 'interpretation_html': interpretation_html,
                 'predictions_html': predictions_html
             }
-        }), 200
+        }
+        return app.response_class(calc.to_json(report), mimetype='application/json'), 200
+
+    except Exception as e:
+        return jsonify({'ok': False, 'error': str(e)}), 400
+
+# ---------------------------------------------------------------------------
+# NEW: Batch API (many charts per request, e.g. compatibility or cohort scans)
+# ---------------------------------------------------------------------------
+MAX_BATCH_CHARTS = 500
+# Nominatim allows one request per second, so a batch may only name a few
+# cities; the rest of its entries must carry lat/lon
+MAX_BATCH_CITIES = 10
+
+@app.route('/api/calculate-batch', methods=['POST'])
+def api_calculate_batch():
+    """
+    Calculate several charts in one request: {"charts": [{...}, ...]}
+    Each entry takes the /api/calculate inputs (camelCase or snake_case).
+    A batch holds at most MAX_BATCH_CHARTS charts and names at most
+    MAX_BATCH_CITIES distinct cities, each geocoded once. Every chart is
+    calculated in this worker process; there are no worker processes.
+    """
+    try:
+        data = request.get_json(force=True, silent=True) or {}
+        entries = data.get('charts')
+        if not isinstance(entries, list) or not entries:
+            return jsonify({'ok': False, 'error': 'charts must be a non-empty list'}), 400
+        if len(entries) > MAX_BATCH_CHARTS:
+            return jsonify({'ok': False, 'error': f'at most {MAX_BATCH_CHARTS} charts per batch'}), 400
+
+        calc = ProfessionalAstrologyEngine()
+
+        # Parse every entry first so one bad entry fails the batch before any work
+        parsed = []
+        for index, entry in enumerate(entries):
+            birth_date = entry.get('birth_date') or entry.get('birthDate')
+            birth_time = entry.get('birth_time') or entry.get('birthTime')
+            house_system = entry.get('house_system') or entry.get('houseSystem') or 'placidus'
+            birth_city = (entry.get('birth_city') or entry.get('birthPlace') or '').strip()
+            lat = entry.get('latitude', entry.get('lat', None))
+            lon = entry.get('longitude', entry.get('lon', None))
+
+            if not birth_date or not birth_time:
+                return jsonify({'ok': False, 'error': f'charts[{index}]: birthDate/birth_date and birthTime/birth_time are required'}), 400
+            bt = birth_time.strip()
+            fmt = '%Y-%m-%d %H:%M' if len(bt) == 5 else '%Y-%m-%d %H:%M:%S'
+            birth_dt = datetime.strptime(f"{birth_date} {bt}", fmt)
+
+            if lat is not None and lon is not None:
+                lat_val = float(lat); lon_val = float(lon)
+                if not (-90 <= lat_val <= 90) or not (-180 <= lon_val <= 180):
+                    return jsonify({'ok': False, 'error': f'charts[{index}]: lat must be -90..90 and lon must be -180..180'}), 400
+                coords = (lat_val, lon_val, f"{lat_val:.4f}, {lon_val:.4f}")
+            elif len(birth_city) >= 2:
+                coords = birth_city
+            else:
+                return jsonify({'ok': False, 'error': f'charts[{index}]: Provide birthPlace/birth_city or lat+lon'}), 400
+            parsed.append((birth_dt, coords, house_system, entry))
+
+        # Geocode each distinct city once
+        city_names = list(dict.fromkeys(coords for _, coords, _, _ in parsed if isinstance(coords, str)))
+        if len(city_names) > MAX_BATCH_CITIES:
+            return jsonify({'ok': False, 'error': f'at most {MAX_BATCH_CITIES} distinct cities per batch; send lat+lon for the rest'}), 400
+        cities = calc.get_coordinates_for_cities(city_names)
+        locations = [cities[coords] if isinstance(coords, str) else coords
+                     for _, coords, _, _ in parsed]
+        for index, ((_, coords, _, _), (_, _, location_name)) in enumerate(zip(parsed, locations)):
+            if isinstance(coords, str) and "coordinates needed" in location_name.lower():
+                return jsonify({'ok': False, 'error': f"charts[{index}]: could not geocode '{coords}'; use lat+lon instead"}), 400
+
+        charts = calc.calculate_professional_charts_batch(
+            [(birth_dt, lat_val, lon_val, house_system)
+             for (birth_dt, _, house_system, _), (lat_val, lon_val, _) in zip(parsed, locations)])
+
+        for chart, (_, _, house_system, entry), (lat_val, lon_val, location_name) in zip(charts, parsed, locations):
+            chart.update({
+                'birth_date': entry.get('birth_date') or entry.get('birthDate'),
+                'birth_time': entry.get('birth_time') or entry.get('birthTime'),
+                'birth_location': location_name,
+                'coordinates': f"{lat_val:.4f}, {lon_val:.4f}",
+                'timezone': entry.get('timezone') or entry.get('tz') or 'UTC',
+                'house_system': house_system
+            })
+
+        return app.response_class(calc.to_json({'ok': True, 'charts': charts}), mimetype='application/json'), 200
 
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 400
@@ -1,59 +1,25 @@
 from datetime import datetime, timezone
 import math
 
+from geocoding import geocode_city
+
 class AstrologyCalculator:
     """Simple astrology calculator using basic astronomical formulas"""
     
-    ZODIAC_SIGNS = [
+    ZODIAC_SIGNS = (
         'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
         'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
-    ]
+    )
     
     def __init__(self):
         pass
     
     def get_coordinates_for_city(self, city_name):
         """Get coordinates for any city worldwide using Nominatim (OpenStreetMap)"""
-        import requests
-        import time
-        
         try:
-            # Use Nominatim API for worldwide geocoding
-            url = "https://nominatim.openstreetmap.org/search"
-            params = {
-                'q': city_name,
-                'format': 'json',
-                'limit': 1,
-                'addressdetails': 1
-            }
-            
-            headers = {
-                'User-Agent': 'AstroApp/1.0 (astrology birth chart calculator)'
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data:
-                    result = data[0]
-                    lat = float(result['lat'])
-                    lon = float(result['lon'])
-                    
-                    # Extract clean location name
-                    display_name = result.get('display_name', city_name)
-                    # Simplify the display name (take first 3 parts usually covers city, state, country)
-                    location_parts = display_name.split(', ')[:3]
-                    clean_name = ', '.join(location_parts)
-                    
-                    return (lat, lon, clean_name)
-            
-            # If API fails, fall back to local database
-            return self._fallback_city_lookup(city_name)
-            
-        except Exception as e:
-            # If anything goes wrong, use fallback
+            return geocode_city(city_name.lower().strip())
+        except Exception:
+            # If the lookup fails or finds nothing, fall back to the local table
             return self._fallback_city_lookup(city_name)
     
     def _fallback_city_lookup(self, city_name):
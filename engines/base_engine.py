@@ -88,18 +88,14 @@ class EnhancedBaseEngine:
         # Sun's mean anomaly
         M_sun = 357.5291092 + 35999.0502909 * T - 0.0001536 * T**2
         
-        # Moon's argument of latitude
-        F = 93.2720950 + 483202.0175233 * T - 0.0036539 * T**2
-        
-        # Convert to radians
+        # Convert to radians (the argument of latitude does not enter these terms)
         M_rad = math.radians(M)
-        M_sun_rad = math.radians(M_sun)
-        F_rad = math.radians(F)
+        two_D = 2 * math.radians(L - M_sun)
         
         # Main corrections
         longitude = L + 6.288774 * math.sin(M_rad)
-        longitude += 1.274027 * math.sin(2 * math.radians(L - M_sun) - M_rad)
-        longitude += 0.658314 * math.sin(2 * math.radians(L - M_sun))
+        longitude += 1.274027 * math.sin(two_D - M_rad)
+        longitude += 0.658314 * math.sin(two_D)
         longitude += 0.213618 * math.sin(2 * M_rad)
         
         return longitude % 360
@@ -125,48 +121,38 @@ class EnhancedBaseEngine:
         sidereal = tropical_longitude - ayanamsa
         return sidereal % 360
     
+    # Orbital elements per planet as (L0, L1, L2, M0, M1, M2, e0, e1, e2):
+    # mean longitude, mean anomaly and eccentricity are each x0 + x1*T + x2*T**2
+    PLANET_ELEMENTS = (
+        ('mercury', (252.250906, 149474.0722491, 0.00030397,
+                     174.7948, 149472.51529, 0.00008444,
+                     0.20563175, 0.000020406, -0.0000000284)),
+        ('venus', (181.979801, 58519.2130302, 0.00031014,
+                   50.4161, 58517.81539, 0.00008567,
+                   0.00677188, -0.000047766, 0.0000000975)),
+        ('mars', (355.433275, 19141.6964746, 0.00031097,
+                  19.3730, 19139.85475, 0.00000181,
+                  0.09340062, 0.000090483, -0.0000000806)),
+        ('jupiter', (34.351484, 3036.3027748, 0.00022330,
+                     20.0202, 3034.90567, -0.00000023,
+                     0.04849485, 0.000163244, -0.0000004719)),
+        ('saturn', (50.077471, 1223.5110686, 0.00051952,
+                    317.0207, 1222.11494, 0.00000611,
+                    0.05554814, -0.000346641, -0.0000006436)),
+    )
+    
     # Enhanced planetary positions
     def enhanced_planetary_positions(self, jd):
         """Calculate enhanced planetary positions"""
         T = (jd - 2451545.0) / 36525.0  # Centuries since J2000
+        T2 = T**2
         
         planets = {}
-        
-        # Mercury - enhanced calculation
-        mercury_L = 252.250906 + 149474.0722491 * T + 0.00030397 * T**2
-        mercury_a = 0.38709830
-        mercury_e = 0.20563175 + 0.000020406 * T - 0.0000000284 * T**2
-        mercury_M = 174.7948 + 149472.51529 * T + 0.00008444 * T**2
-        mercury_longitude = self._calculate_planet_longitude(mercury_L, mercury_M, mercury_e)
-        planets['mercury'] = mercury_longitude % 360
-        
-        # Venus - enhanced calculation  
-        venus_L = 181.979801 + 58519.2130302 * T + 0.00031014 * T**2
-        venus_M = 50.4161 + 58517.81539 * T + 0.00008567 * T**2
-        venus_e = 0.00677188 - 0.000047766 * T + 0.0000000975 * T**2
-        venus_longitude = self._calculate_planet_longitude(venus_L, venus_M, venus_e)
-        planets['venus'] = venus_longitude % 360
-        
-        # Mars - enhanced calculation
-        mars_L = 355.433275 + 19141.6964746 * T + 0.00031097 * T**2
-        mars_M = 19.3730 + 19139.85475 * T + 0.00000181 * T**2  
-        mars_e = 0.09340062 + 0.000090483 * T - 0.0000000806 * T**2
-        mars_longitude = self._calculate_planet_longitude(mars_L, mars_M, mars_e)
-        planets['mars'] = mars_longitude % 360
-        
-        # Jupiter - enhanced calculation
-        jupiter_L = 34.351484 + 3036.3027748 * T + 0.00022330 * T**2
-        jupiter_M = 20.0202 + 3034.90567 * T - 0.00000023 * T**2
-        jupiter_e = 0.04849485 + 0.000163244 * T - 0.0000004719 * T**2
-        jupiter_longitude = self._calculate_planet_longitude(jupiter_L, jupiter_M, jupiter_e)
-        planets['jupiter'] = jupiter_longitude % 360
-        
-        # Saturn - enhanced calculation
-        saturn_L = 50.077471 + 1223.5110686 * T + 0.00051952 * T**2
-        saturn_M = 317.0207 + 1222.11494 * T + 0.00000611 * T**2
-        saturn_e = 0.05554814 - 0.000346641 * T - 0.0000006436 * T**2
-        saturn_longitude = self._calculate_planet_longitude(saturn_L, saturn_M, saturn_e)
-        planets['saturn'] = saturn_longitude % 360
+        for name, (L0, L1, L2, M0, M1, M2, e0, e1, e2) in self.PLANET_ELEMENTS:
+            longitude = self._calculate_planet_longitude(L0 + L1 * T + L2 * T2,
+                                                         M0 + M1 * T + M2 * T2,
+                                                         e0 + e1 * T + e2 * T2)
+            planets[name] = longitude % 360
         
         return planets
     
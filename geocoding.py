@@ -0,0 +1,138 @@
+"""
+Nominatim (OpenStreetMap) geocoding shared by every calculator
+
+One keep-alive session and one rate limiter per process, so all lookups
+go out under the same identity and the public service's one request per
+second policy. Results are cached in memory and on disk.
+"""
+
+import functools
+import os
+import shelve
+import threading
+import time
+
+# orjson parses much faster when installed; json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Endpoint, identity, rate limit and cache lifetimes
+_NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+_NOMINATIM_HEADERS = {
+    'User-Agent': 'AstroApp-Professional/2.0 (astrology software)'
+}
+_NOMINATIM_MIN_INTERVAL = 1.0
+_NOMINATIM_TIMEOUT = (3, 10)  # connect, read
+_NOMINATIM_RETRIES = 2  # gateway errors only, with a short backoff
+_NOMINATIM_RETRY_BACKOFF = 0.2
+_NOMINATIM_RETRY_STATUSES = (502, 503, 504)
+_NOMINATIM_POOL_SIZE = 10
+_GEOCODE_TTL_SECONDS = 30 * 24 * 3600
+_GEOCODE_MISS_TTL_SECONDS = 3600
+_GEOCODE_DB_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'astro', 'geocode.db')
+
+_geocode_lock = threading.Lock()  # guards _geocode_last_request only
+_geocode_db_lock = threading.Lock()
+_geocode_session = None
+_geocode_last_request = 0.0
+
+
+def _nominatim_session():
+    """Shared requests.Session with a small keep-alive pool, retrying gateway errors"""
+    global _geocode_session
+    if _geocode_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers.update(_NOMINATIM_HEADERS)
+        retries = Retry(total=_NOMINATIM_RETRIES, backoff_factor=_NOMINATIM_RETRY_BACKOFF,
+                        status_forcelist=_NOMINATIM_RETRY_STATUSES)
+        session.mount('https://', HTTPAdapter(pool_connections=_NOMINATIM_POOL_SIZE,
+                                              pool_maxsize=_NOMINATIM_POOL_SIZE, max_retries=retries))
+        _geocode_session = session
+    return _geocode_session
+
+
+def _read_geocode_db(city_key):
+    """
+    Return the cached (timestamp, result) entry for a city if it is still fresh, or None
+    
+    result is (lat, lon, name), or None for a name Nominatim did not know;
+    those misses expire after _GEOCODE_MISS_TTL_SECONDS.
+    """
+    try:
+        with shelve.open(_GEOCODE_DB_PATH, flag='r') as db:
+            entry = db.get(city_key)
+    except Exception:
+        return None
+    if entry is None:
+        return None
+    ttl = _GEOCODE_TTL_SECONDS if entry[1] is not None else _GEOCODE_MISS_TTL_SECONDS
+    if time.time() - entry[0] > ttl:
+        return None
+    return entry
+
+
+def _write_geocode_db(city_key, result):
+    try:
+        os.makedirs(os.path.dirname(_GEOCODE_DB_PATH), exist_ok=True)
+        with _geocode_db_lock, shelve.open(_GEOCODE_DB_PATH) as db:
+            db[city_key] = (time.time(), result)
+    except Exception:
+        pass
+
+
+def _reserve_nominatim_slot():
+    """Claim the next request slot under Nominatim's one-per-second policy and return its time"""
+    global _geocode_last_request
+    with _geocode_lock:
+        slot = max(time.monotonic(), _geocode_last_request + _NOMINATIM_MIN_INTERVAL)
+        _geocode_last_request = slot
+    return slot
+
+
+@functools.lru_cache(maxsize=4096)
+def geocode_city(city_key):
+    """
+    Resolve a lowercased city name to (lat, lon, clean_name) via Nominatim
+    
+    Raises LookupError when Nominatim has no match. Misses are remembered on
+    disk for a short TTL; network and HTTP errors are not cached, so the
+    next call retries. Only the rate-limit slot is taken under the lock, so
+    disk hits and lookups already in flight do not wait on each other.
+    """
+    entry = _read_geocode_db(city_key)
+    if entry is not None:
+        if entry[1] is None:
+            raise LookupError(city_key)
+        return entry[1]
+    
+    wait = _reserve_nominatim_slot() - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+    params = {
+        'q': city_key,
+        'format': 'json',
+        'limit': 1,
+        'addressdetails': 1
+    }
+    response = _nominatim_session().get(_NOMINATIM_URL, params=params,
+                                     timeout=_NOMINATIM_TIMEOUT)
+    if response.status_code != 200:
+        raise LookupError(city_key)
+    
+    data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    if not data:
+        _write_geocode_db(city_key, None)
+        raise LookupError(city_key)
+    
+    first = data[0]
+    display_name = first.get('display_name', city_key)
+    result = (float(first['lat']), float(first['lon']), ', '.join(display_name.split(', ')[:3]))
+    _write_geocode_db(city_key, result)
+    return result
@@ -2,24 +2,187 @@
 # Precision Validation Framework for Astrology App
 # Add this file to your GitHub repository now!
 
+import bisect
 import datetime
 import math
+from collections import deque, namedtuple
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple, Any
 import json
 
+# orjson serializes reports much faster when installed; json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _freeze(value):
+    """Read-only copy of nested dicts and lists: mapping proxies and tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Test data with known accurate positions, built once at import and
+# shared by every validator instance; frozen so no instance can change
+# it under the others or under _BASIC_CASES
+_BENCHMARK_DATA = _freeze({
+    # Simple test cases for immediate validation
+    'basic_tests': [
+        {
+            'name': 'New Year 2024 Test',
+            'date': datetime.datetime(2024, 1, 1, 12, 0, 0),
+            'location': {'lat': 0.0, 'lng': 0.0},  # Equator reference
+            'expected': {
+                'sun_sign': 'Capricorn',
+                'sun_longitude': 280.0,  # Approximate
+            }
+        },
+        {
+            'name': 'Spring Equinox 2024',
+            'date': datetime.datetime(2024, 3, 20, 9, 6, 0),
+            'location': {'lat': 0.0, 'lng': 0.0},
+            'expected': {
+                'sun_sign': 'Aries',
+                'sun_longitude': 0.0,  # Exactly 0° at equinox
+            }
+        }
+    ],
+    
+    # Real birth chart for testing (Gandhi - public data)
+    'historical_charts': [
+        {
+            'name': 'Gandhi Test Chart',
+            'date': datetime.datetime(1869, 10, 2, 7, 33, 0),
+            'location': {'lat': 21.52, 'lng': 69.66},  # Porbandar
+            'expected': {
+                'sun_sign': 'Libra',
+                'moon_sign': 'Scorpio',
+                'ascendant_sign': 'Libra'
+            }
+        }
+    ]
+})
+
+# Basic test case fields unpacked once for the validation loop
+_BenchmarkCase = namedtuple('_BenchmarkCase', 'name iso_date date lat lng expected')
+
+def _unpack_basic_tests(basic_tests) -> Tuple[_BenchmarkCase, ...]:
+    return tuple(
+        _BenchmarkCase(test['name'], test['date'].isoformat(), test['date'],
+                       test['location']['lat'], test['location']['lng'], test['expected'])
+        for test in basic_tests
+    )
+
+_BASIC_CASES = _unpack_basic_tests(_BENCHMARK_DATA['basic_tests'])
+
+# Math library self-test; its outcome cannot change within one interpreter
+_MATH_SELFTEST_OK = abs(math.sin(math.radians(30)) - 0.5) < 0.001  # sin 30° should be 0.5
+_MATH_PASS_TEST = {
+    'name': 'Mathematical Operations',
+    'status': 'PASS',
+    'message': 'Math library functioning correctly'
+}
+_MATH_FAIL_TEST = {
+    'name': 'Mathematical Operations',
+    'status': 'FAIL',
+    'message': 'Math calculations showing errors'
+}
+
+# Score tiers, lowest first: bisect_right(thresholds, score) picks the entry,
+# so a score equal to a threshold falls into the tier above it
+_HEALTH_THRESHOLDS = (0.5, 0.8)
+_HEALTH_STATUSES = ('POOR', 'FAIR', 'HEALTHY')
+_HEALTH_RECOMMENDATIONS = (
+    '❌ Critical issues - fix before proceeding',
+    '⚠️ Some issues detected - proceed with caution',
+    '✅ System ready for precision testing',
+)
+
+_ACCURACY_THRESHOLDS = (0.5, 0.7, 0.9)
+_ACCURACY_RECOMMENDATIONS = (
+    '❌ Poor accuracy - major fixes required',
+    '⚠️ Fair accuracy - significant improvements needed',
+    '✅ Good accuracy - minor improvements possible',
+    '🌟 Excellent planetary accuracy!',
+)
+
+_OVERALL_THRESHOLDS = (0.50, 0.70, 0.85)
+_OVERALL_GUIDANCE = (
+    ('❌ Poor accuracy - major fixes required',
+     ('Debug core calculation issues immediately',
+      'Consider using established astronomy libraries')),
+    ('⚠️ Fair accuracy - significant improvements needed',
+     ('Review and enhance core calculation algorithms',
+      'Implement better astronomical data sources')),
+    ('✅ Good accuracy - minor optimizations recommended',
+     ('Focus on improving planetary calculation precision',
+      'Add more comprehensive test cases')),
+    ('🌟 Excellent overall accuracy - system ready for production',
+     ('Consider adding advanced features like house calculations',
+      'Implement birth time rectification capabilities')),
+)
+
+# Comprehensive report scaffold; key order matches the published report
+_COMPREHENSIVE_PROTOTYPE = {
+    'timestamp': None,
+    'version': '1.0.0',
+    'components': {},
+    'overall_score': 0.0,
+    'recommendations': [],
+    'next_steps': []
+}
+
+# Improvement suggestions shown after validation
+_IMPROVEMENT_SUGGESTIONS = (
+    "1. 🎯 Immediate Actions:",
+    "   • Run validation daily to track improvements",
+    "   • Fix any failing health checks first",
+    "   • Test with multiple birth dates and locations",
+    "",
+    "2. 📈 Accuracy Improvements:",
+    "   • Upgrade to Swiss Ephemeris for planetary positions",
+    "   • Add proper birth location handling for rising signs",
+    "   • Implement multiple ayanamsa systems for Vedic astrology",
+    "",
+    "3. 🔧 Technical Enhancements:",
+    "   • Add house system calculations (Placidus, Koch, Equal)",
+    "   • Implement aspect calculations with proper orbs",
+    "   • Add birth time rectification algorithms",
+    "",
+    "4. 🎨 User Experience:",
+    "   • Add visual chart wheels",
+    "   • Implement detailed interpretations",
+    "   • Create comparison and synastry features"
+)
+
 class PrecisionValidationFramework:
     """
     Step-by-step validation framework that integrates with your existing astrology app.
     This validates accuracy and provides recommendations for improvements.
     """
     
-    def __init__(self, astro_calculator=None):
-        """Initialize with your existing astrology calculator"""
-        self.astro_calculator = astro_calculator
-        self.results_history = []
+    __slots__ = ('_astro_calculator', '_calc_planets', 'verbose', 'results_history',
+                 'tolerances', 'benchmark_data', '_health_probe', '_health_probe_calculator',
+                 '_mock_tests', '_mock_tests_cases')
+    
+    def __init__(self, astro_calculator=None, verbose: bool = True, history_size: int = 128):
+        """
+        Initialize with your existing astrology calculator
         
-        print("🔧 Precision Validation Framework initialized")
-        print("📊 Ready to validate your astrology calculations!")
+        Args:
+            astro_calculator: Calculator to validate, or None for mock data
+            verbose: Print progress messages; pass False when serving requests
+            history_size: Number of comprehensive reports kept in results_history
+        """
+        self.astro_calculator = astro_calculator  # also binds _calc_planets
+        self.verbose = verbose
+        self.results_history = deque(maxlen=history_size)  # oldest reports drop off
+        
+        self.log("🔧 Precision Validation Framework initialized")
+        self.log("📊 Ready to validate your astrology calculations!")
         
         # Validation tolerances (start relaxed, tighten as we improve)
         self.tolerances = {
@@ -29,263 +192,291 @@ class PrecisionValidationFramework:
         }
         
         # Test data for validation
-        self.benchmark_data = self.initialize_test_data()
+        self.benchmark_data = _BENCHMARK_DATA
+        
+        # Static health check results and the calculator they were built for
+        self._health_probe = None
+        self._health_probe_calculator = None
+        
+        # Mock planetary test results and the cases they were built from
+        self._mock_tests = None
+        self._mock_tests_cases = None
+    
+    def log(self, message: str):
+        """Print a progress message when running verbosely"""
+        if self.verbose:
+            print(message)
+    
+    @property
+    def astro_calculator(self):
+        return self._astro_calculator
+    
+    @astro_calculator.setter
+    def astro_calculator(self, calculator):
+        # Bind calculate_planets once instead of probing for it per test
+        self._astro_calculator = calculator
+        self._calc_planets = getattr(calculator, 'calculate_planets', None) if calculator else None
     
     def initialize_test_data(self):
-        """Initialize test data with known accurate positions"""
-        return {
-            # Simple test cases for immediate validation
-            'basic_tests': [
-                {
-                    'name': 'New Year 2024 Test',
-                    'date': datetime.datetime(2024, 1, 1, 12, 0, 0),
-                    'location': {'lat': 0.0, 'lng': 0.0},  # Equator reference
-                    'expected': {
-                        'sun_sign': 'Capricorn',
-                        'sun_longitude': 280.0,  # Approximate
-                    }
-                },
-                {
-                    'name': 'Spring Equinox 2024',
-                    'date': datetime.datetime(2024, 3, 20, 9, 6, 0),
-                    'location': {'lat': 0.0, 'lng': 0.0},
-                    'expected': {
-                        'sun_sign': 'Aries',
-                        'sun_longitude': 0.0,  # Exactly 0° at equinox
-                    }
-                }
-            ],
-            
-            # Real birth chart for testing (Gandhi - public data)
-            'historical_charts': [
-                {
-                    'name': 'Gandhi Test Chart',
-                    'date': datetime.datetime(1869, 10, 2, 7, 33, 0),
-                    'location': {'lat': 21.52, 'lng': 69.66},  # Porbandar
-                    'expected': {
-                        'sun_sign': 'Libra',
-                        'moon_sign': 'Scorpio',
-                        'ascendant_sign': 'Libra'
-                    }
-                }
-            ]
-        }
+        """Return the shared, read-only test data with known accurate positions"""
+        return _BENCHMARK_DATA
     
-    def quick_health_check(self) -> Dict[str, Any]:
+    def quick_health_check(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         STEP 1: Run this first to check system health
+        
+        Args:
+            timestamp: ISO timestamp for the report; defaults to now
         """
-        print("\n🏥 Running Quick System Health Check...")
+        self.log("\n🏥 Running Quick System Health Check...")
         
         health_report = {
-            'timestamp': datetime.datetime.now().isoformat(),
+            'timestamp': timestamp or datetime.datetime.now().isoformat(),
             'status': 'UNKNOWN',
             'tests': [],
             'summary': {'total': 0, 'passed': 0, 'failed': 0},
             'recommendations': []
         }
         
-        # Test 1: Check if astrology calculator is available
-        if self.astro_calculator:
-            health_report['tests'].append({
-                'name': 'Astrology Calculator Connection',
-                'status': 'PASS',
-                'message': 'Calculator is connected and ready'
-            })
-            health_report['summary']['passed'] += 1
-        else:
-            health_report['tests'].append({
-                'name': 'Astrology Calculator Connection', 
-                'status': 'WARNING',
-                'message': 'No calculator connected - will use mock data for testing'
-            })
-        
-        health_report['summary']['total'] += 1
+        # Tests 1 and 3 only depend on the attached calculator, so they are cached
+        calculator_test, math_test = self._static_health_probe()
         
         # Test 2: Check date/time handling
         try:
             test_date = datetime.datetime.now()
-            health_report['tests'].append({
+            date_test = {
                 'name': 'Date/Time Processing',
                 'status': 'PASS',
                 'message': f'Date processing working: {test_date}'
-            })
-            health_report['summary']['passed'] += 1
+            }
         except Exception as e:
-            health_report['tests'].append({
+            date_test = {
                 'name': 'Date/Time Processing',
                 'status': 'FAIL', 
                 'message': f'Date processing error: {str(e)}'
-            })
-            health_report['summary']['failed'] += 1
-        
-        health_report['summary']['total'] += 1
+            }
         
-        # Test 3: Math operations
-        try:
-            test_calc = math.sin(math.radians(30))  # Should be 0.5
-            if abs(test_calc - 0.5) < 0.001:
-                health_report['tests'].append({
-                    'name': 'Mathematical Operations',
-                    'status': 'PASS',
-                    'message': 'Math library functioning correctly'
-                })
-                health_report['summary']['passed'] += 1
-            else:
-                health_report['tests'].append({
-                    'name': 'Mathematical Operations',
-                    'status': 'FAIL',
-                    'message': 'Math calculations showing errors'
-                })
-                health_report['summary']['failed'] += 1
-        except Exception as e:
-            health_report['tests'].append({
-                'name': 'Mathematical Operations',
-                'status': 'FAIL',
-                'message': f'Math error: {str(e)}'
-            })
-            health_report['summary']['failed'] += 1
-            
-        health_report['summary']['total'] += 1
+        # Copy the cached tests so callers can't modify the cache
+        health_report['tests'] = [dict(calculator_test), date_test, dict(math_test)]
+        summary = health_report['summary']
+        for test in health_report['tests']:
+            if test['status'] == 'PASS':
+                summary['passed'] += 1
+            elif test['status'] == 'FAIL':
+                summary['failed'] += 1
+            summary['total'] += 1
         
         # Determine overall health
         pass_rate = health_report['summary']['passed'] / health_report['summary']['total']
-        if pass_rate >= 0.8:
-            health_report['status'] = 'HEALTHY'
-        elif pass_rate >= 0.5:
-            health_report['status'] = 'FAIR'  
-        else:
-            health_report['status'] = 'POOR'
+        tier = bisect.bisect_right(_HEALTH_THRESHOLDS, pass_rate)
+        health_report['status'] = _HEALTH_STATUSES[tier]
             
         # Add recommendations
-        if health_report['status'] == 'HEALTHY':
-            health_report['recommendations'].append('✅ System ready for precision testing')
-        elif health_report['status'] == 'FAIR':
-            health_report['recommendations'].append('⚠️ Some issues detected - proceed with caution')
-        else:
-            health_report['recommendations'].append('❌ Critical issues - fix before proceeding')
+        health_report['recommendations'].append(_HEALTH_RECOMMENDATIONS[tier])
         
-        print(f"✅ Health Check Complete: Status = {health_report['status']}")
-        print(f"📊 Score: {health_report['summary']['passed']}/{health_report['summary']['total']}")
+        self.log(f"✅ Health Check Complete: Status = {health_report['status']}")
+        self.log(f"📊 Score: {health_report['summary']['passed']}/{health_report['summary']['total']}")
         
         return health_report
     
-    def validate_planetary_calculations(self) -> Dict[str, Any]:
+    def _static_health_probe(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Calculator connection and math test results, cached per attached calculator"""
+        calculator = self.astro_calculator
+        if self._health_probe is not None and self._health_probe_calculator is calculator:
+            return self._health_probe
+        
+        # Test 1: Check if astrology calculator is available
+        if calculator:
+            calculator_test = {
+                'name': 'Astrology Calculator Connection',
+                'status': 'PASS',
+                'message': 'Calculator is connected and ready'
+            }
+        else:
+            calculator_test = {
+                'name': 'Astrology Calculator Connection', 
+                'status': 'WARNING',
+                'message': 'No calculator connected - will use mock data for testing'
+            }
+        
+        # Test 3: Math operations, evaluated once at import
+        math_test = _MATH_PASS_TEST if _MATH_SELFTEST_OK else _MATH_FAIL_TEST
+        
+        self._health_probe = (calculator_test, math_test)
+        self._health_probe_calculator = calculator
+        return self._health_probe
+    
+    def validate_planetary_calculations(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         STEP 2: Validate planetary position calculations
+        
+        Args:
+            timestamp: ISO timestamp for the report; defaults to now
         """
-        print("\n🌍 Validating Planetary Calculations...")
+        self.log("\n🌍 Validating Planetary Calculations...")
         
         validation_report = {
-            'timestamp': datetime.datetime.now().isoformat(),
+            'timestamp': timestamp or datetime.datetime.now().isoformat(),
             'method': 'Basic Planetary Position Validation',
             'tests': [],
             'summary': {'total': 0, 'passed': 0, 'accuracy': 0.0},
             'recommendations': []
         }
         
-        for test_case in self.benchmark_data['basic_tests']:
+        # The shared data is frozen, so its cases can be unpacked once at import
+        if self.benchmark_data is _BENCHMARK_DATA:
+            cases = _BASIC_CASES
+        else:
+            cases = _unpack_basic_tests(self.benchmark_data['basic_tests'])
+        
+        # If we have a real calculator, use it
+        if self._calc_planets is not None:
+            tests, passed = self._run_planetary_tests(cases)
+        else:
+            tests, passed = self._mock_planetary_tests(cases)
+        
+        validation_report['tests'] = tests
+        validation_report['summary']['total'] = len(tests)
+        validation_report['summary']['passed'] = passed
+        
+        # Calculate accuracy
+        if validation_report['summary']['total'] > 0:
+            validation_report['summary']['accuracy'] = (
+                validation_report['summary']['passed'] / validation_report['summary']['total']
+            )
+        
+        # Add recommendations based on results
+        accuracy = validation_report['summary']['accuracy']
+        tier = bisect.bisect_right(_ACCURACY_THRESHOLDS, accuracy)
+        validation_report['recommendations'].append(_ACCURACY_RECOMMENDATIONS[tier])
+            
+        self.log(f"📊 Planetary Validation: {accuracy:.1%} accuracy")
+        
+        return validation_report
+    
+    def _run_planetary_tests(self, cases: Tuple[_BenchmarkCase, ...]) -> Tuple[List[Dict[str, Any]], int]:
+        """Compare calculated sun positions with the benchmark; returns (test results, passed count)"""
+        calculated_positions = self._calculate_benchmark_positions(cases)
+        tolerance = self.tolerances['planetary_position']
+        tests = []
+        passed = 0
+        
+        for test_case, calculated in zip(cases, calculated_positions):
             test_result = {
-                'name': test_case['name'],
-                'date': test_case['date'].isoformat(),
+                'name': test_case.name,
+                'date': test_case.iso_date,
                 'status': 'UNKNOWN',
                 'details': {}
             }
             
             try:
-                # If we have a real calculator, use it
-                if self.astro_calculator and hasattr(self.astro_calculator, 'calculate_planets'):
-                    calculated = self.astro_calculator.calculate_planets(
-                        test_case['date'], 
-                        test_case['location']['lat'], 
-                        test_case['location']['lng']
-                    )
+                if isinstance(calculated, Exception):
+                    raise calculated
+                
+                # Compare sun position
+                if 'sun_longitude' in calculated and 'sun_longitude' in test_case.expected:
+                    calc_sun = calculated['sun_longitude']
+                    expected_sun = test_case.expected['sun_longitude']
+                    error = abs(calc_sun - expected_sun)
+                    within_tolerance = error <= tolerance
                     
-                    # Compare sun position
-                    if 'sun_longitude' in calculated and 'sun_longitude' in test_case['expected']:
-                        calc_sun = calculated['sun_longitude']
-                        expected_sun = test_case['expected']['sun_longitude']
-                        error = abs(calc_sun - expected_sun)
-                        
-                        test_result['details']['sun_position'] = {
-                            'calculated': calc_sun,
-                            'expected': expected_sun,
-                            'error_degrees': error,
-                            'within_tolerance': error <= self.tolerances['planetary_position']
-                        }
-                        
-                        if error <= self.tolerances['planetary_position']:
-                            test_result['status'] = 'PASS'
-                            validation_report['summary']['passed'] += 1
-                        else:
-                            test_result['status'] = 'FAIL'
+                    test_result['details']['sun_position'] = {
+                        'calculated': calc_sun,
+                        'expected': expected_sun,
+                        'error_degrees': error,
+                        'within_tolerance': within_tolerance
+                    }
+                    
+                    if within_tolerance:
+                        test_result['status'] = 'PASS'
+                        passed += 1
                     else:
-                        test_result['status'] = 'SKIP'
-                        test_result['message'] = 'Sun position not available in calculations'
-                        
+                        test_result['status'] = 'FAIL'
                 else:
+                    test_result['status'] = 'SKIP'
+                    test_result['message'] = 'Sun position not available in calculations'
+                    
+            except Exception as e:
+                test_result['status'] = 'ERROR'
+                test_result['error'] = str(e)
+            
+            tests.append(test_result)
+        
+        return tests, passed
+    
+    def _mock_planetary_tests(self, cases: Tuple[_BenchmarkCase, ...]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Mock test results used when no calculator is connected. They only
+        depend on the cases, so they are built once and copied per report.
+        """
+        if self._mock_tests is None or self._mock_tests_cases is not cases:
+            tests = []
+            passed = 0
+            for test_case in cases:
+                test_result = {
+                    'name': test_case.name,
+                    'date': test_case.iso_date,
+                    'status': 'UNKNOWN',
+                    'details': {}
+                }
+                
+                try:
                     # Mock validation for testing framework
                     test_result['status'] = 'MOCK'
                     test_result['message'] = 'Using mock data - calculator not connected'
                     test_result['details']['sun_position'] = {
-                        'calculated': test_case['expected']['sun_longitude'] + 0.1,  # Small mock error
-                        'expected': test_case['expected']['sun_longitude'],
+                        'calculated': test_case.expected['sun_longitude'] + 0.1,  # Small mock error
+                        'expected': test_case.expected['sun_longitude'],
                         'error_degrees': 0.1,
                         'within_tolerance': True
                     }
-                    validation_report['summary']['passed'] += 1
-                    
-            except Exception as e:
-                test_result['status'] = 'ERROR'
-                test_result['error'] = str(e)
-            
-            validation_report['tests'].append(test_result)
-            validation_report['summary']['total'] += 1
-        
-        # Calculate accuracy
-        if validation_report['summary']['total'] > 0:
-            validation_report['summary']['accuracy'] = (
-                validation_report['summary']['passed'] / validation_report['summary']['total']
-            )
-        
-        # Add recommendations based on results
-        accuracy = validation_report['summary']['accuracy']
-        if accuracy >= 0.9:
-            validation_report['recommendations'].append('🌟 Excellent planetary accuracy!')
-        elif accuracy >= 0.7:
-            validation_report['recommendations'].append('✅ Good accuracy - minor improvements possible')
-        elif accuracy >= 0.5:
-            validation_report['recommendations'].append('⚠️ Fair accuracy - significant improvements needed')
-        else:
-            validation_report['recommendations'].append('❌ Poor accuracy - major fixes required')
+                    passed += 1
+                except Exception as e:
+                    test_result['status'] = 'ERROR'
+                    test_result['error'] = str(e)
+                
+                tests.append(test_result)
             
-        print(f"📊 Planetary Validation: {accuracy:.1%} accuracy")
+            self._mock_tests = (tuple(tests), passed)
+            self._mock_tests_cases = cases
         
-        return validation_report
+        tests, passed = self._mock_tests
+        return [
+            dict(test, details={key: dict(value) for key, value in test['details'].items()})
+            for test in tests
+        ], passed
+    
+    def _calculate_benchmark_positions(self, cases: Tuple[_BenchmarkCase, ...]) -> List[Any]:
+        """Calculator output for each test case, or the exception raised for it"""
+        positions = []
+        for case in cases:
+            try:
+                positions.append(self._calc_planets(case.date, case.lat, case.lng))
+            except Exception as e:
+                positions.append(e)
+        return positions
     
     def run_comprehensive_validation(self) -> Dict[str, Any]:
         """
         STEP 3: Run complete validation suite
         """
-        print("\n🚀 Running Comprehensive Validation Suite...")
-        print("=" * 50)
-        
-        comprehensive_report = {
-            'timestamp': datetime.datetime.now().isoformat(),
-            'version': '1.0.0',
-            'components': {},
-            'overall_score': 0.0,
-            'recommendations': [],
-            'next_steps': []
-        }
+        self.log("\n🚀 Running Comprehensive Validation Suite...")
+        self.log("=" * 50)
+        
+        # One timestamp for the whole run, shared by every component report
+        timestamp = datetime.datetime.now().isoformat()
+        
+        # Shallow copy of the scaffold; the mutable containers are replaced
+        comprehensive_report = dict(_COMPREHENSIVE_PROTOTYPE, timestamp=timestamp,
+                                    components={}, recommendations=[], next_steps=[])
         
         # Run all validation components
         try:
             # Component 1: Health Check
-            comprehensive_report['components']['health_check'] = self.quick_health_check()
+            comprehensive_report['components']['health_check'] = self.quick_health_check(timestamp)
             
             # Component 2: Planetary Validation
-            comprehensive_report['components']['planetary_validation'] = self.validate_planetary_calculations()
+            comprehensive_report['components']['planetary_validation'] = self.validate_planetary_calculations(timestamp)
             
             # Calculate overall score
             scores = []
@@ -303,78 +494,54 @@ class PrecisionValidationFramework:
             
             # Generate overall recommendations
             overall_score = comprehensive_report['overall_score']
-            if overall_score >= 0.85:
-                comprehensive_report['recommendations'].append('🌟 Excellent overall accuracy - system ready for production')
-                comprehensive_report['next_steps'].append('Consider adding advanced features like house calculations')
-                comprehensive_report['next_steps'].append('Implement birth time rectification capabilities')
-            elif overall_score >= 0.70:
-                comprehensive_report['recommendations'].append('✅ Good accuracy - minor optimizations recommended')
-                comprehensive_report['next_steps'].append('Focus on improving planetary calculation precision')
-                comprehensive_report['next_steps'].append('Add more comprehensive test cases')
-            elif overall_score >= 0.50:
-                comprehensive_report['recommendations'].append('⚠️ Fair accuracy - significant improvements needed')
-                comprehensive_report['next_steps'].append('Review and enhance core calculation algorithms')
-                comprehensive_report['next_steps'].append('Implement better astronomical data sources')
-            else:
-                comprehensive_report['recommendations'].append('❌ Poor accuracy - major fixes required')
-                comprehensive_report['next_steps'].append('Debug core calculation issues immediately')
-                comprehensive_report['next_steps'].append('Consider using established astronomy libraries')
+            tier = bisect.bisect_right(_OVERALL_THRESHOLDS, overall_score)
+            recommendation, next_steps = _OVERALL_GUIDANCE[tier]
+            comprehensive_report['recommendations'].append(recommendation)
+            comprehensive_report['next_steps'].extend(next_steps)
             
-            print(f"\n🎯 VALIDATION COMPLETE!")
-            print(f"📊 Overall Score: {overall_score:.1%}")
-            print(f"🔍 System Status: {comprehensive_report['components']['health_check']['status']}")
+            self.log(f"\n🎯 VALIDATION COMPLETE!")
+            self.log(f"📊 Overall Score: {overall_score:.1%}")
+            self.log(f"🔍 System Status: {comprehensive_report['components']['health_check']['status']}")
             
             # Save results
             self.results_history.append(comprehensive_report)
             
         except Exception as e:
             comprehensive_report['error'] = f"Validation failed: {str(e)}"
-            print(f"❌ Validation Error: {str(e)}")
+            self.log(f"❌ Validation Error: {str(e)}")
         
         return comprehensive_report
     
+    def history(self) -> List[Dict[str, Any]]:
+        """Comprehensive reports still held, oldest first"""
+        return list(self.results_history)
+    
+    def to_json(self, report: Dict[str, Any]) -> str:
+        """Serialize a validation report to a compact JSON string; both paths encode the same data"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(report).decode('utf-8')
+        return json.dumps(report, ensure_ascii=False, separators=(',', ':'))
+    
     def get_improvement_suggestions(self) -> List[str]:
         """
         STEP 4: Get specific suggestions for improving accuracy
         """
-        suggestions = [
-            "1. 🎯 Immediate Actions:",
-            "   • Run validation daily to track improvements",
-            "   • Fix any failing health checks first",
-            "   • Test with multiple birth dates and locations",
-            "",
-            "2. 📈 Accuracy Improvements:",
-            "   • Upgrade to Swiss Ephemeris for planetary positions",
-            "   • Add proper birth location handling for rising signs",
-            "   • Implement multiple ayanamsa systems for Vedic astrology",
-            "",
-            "3. 🔧 Technical Enhancements:",
-            "   • Add house system calculations (Placidus, Koch, Equal)",
-            "   • Implement aspect calculations with proper orbs",
-            "   • Add birth time rectification algorithms",
-            "",
-            "4. 🎨 User Experience:",
-            "   • Add visual chart wheels",
-            "   • Implement detailed interpretations",
-            "   • Create comparison and synastry features"
-        ]
-        
-        return suggestions
+        return list(_IMPROVEMENT_SUGGESTIONS)
 
 # Usage functions for easy integration with your existing app
-def validate_astrology_app(calculator=None):
+def validate_astrology_app(calculator=None, verbose: bool = True):
     """
     Quick function to validate your astrology app
     Call this from your main app to run validation
     """
-    validator = PrecisionValidationFramework(calculator)
+    validator = PrecisionValidationFramework(calculator, verbose)
     return validator.run_comprehensive_validation()
 
-def get_app_health_status(calculator=None):
+def get_app_health_status(calculator=None, verbose: bool = True):
     """
     Quick health check for your astrology app
     """
-    validator = PrecisionValidationFramework(calculator)
+    validator = PrecisionValidationFramework(calculator, verbose)
     return validator.quick_health_check()
 
 # Demo function - test the framework
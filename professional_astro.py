@@ -1,5 +1,18 @@
-from datetime import datetime, timezone
+from array import array
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+import bisect
+import functools
+import gzip
+import json
 import math
+import os
+import threading
+import unicodedata
+from types import MappingProxyType
+
+from astro_calc import AstrologyCalculator
+from geocoding import geocode_city
 
 # Import our enhanced engine
 try:
@@ -8,10 +21,514 @@ try:
 except ImportError:
     ENHANCED_ENGINE_AVAILABLE = False
 
+# orjson parses and serializes much faster when installed; json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional skyfield timescale and kernel, loaded once per process on first use;
+# chart math never needs them, so skyfield is not a requirement
+_ephemeris = None
+_ephemeris_lock = threading.Lock()
+
+
+def _load_ephemeris():
+    """Return (timescale, ephemeris), or (None, None) if skyfield cannot load them"""
+    global _ephemeris
+    if _ephemeris is None:
+        with _ephemeris_lock:
+            if _ephemeris is None:
+                try:
+                    from skyfield.api import load
+                    _ephemeris = (load.timescale(), load('de421_excerpt.bsp'))
+                except Exception:
+                    _ephemeris = (None, None)
+    return _ephemeris
+
+_ZODIAC_SIGNS = (
+    'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+    'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
+)
+
+
+def _sign_position(longitude):
+    """(sign name, degrees within sign) for a longitude in [0, 360)"""
+    sign_index, degrees = divmod(longitude, 30)
+    return _ZODIAC_SIGNS[int(sign_index)], degrees
+
+# ---- Numeric kernels shared by the enhanced and standard chart paths ----
+
+# Mean longitude at J2000 and daily motion, degrees
+_MEAN_MOTION = MappingProxyType({
+    'mercury': (252.25, 4.092317),
+    'venus': (181.98, 1.602129),
+    'mars': (355.43, 0.524071),
+    'jupiter': (34.35, 0.083091),
+    'saturn': (50.08, 0.033494),
+    'uranus': (313.23, 0.011773),
+    'neptune': (304.35, 0.006027),
+    'pluto': (238.92, 0.003968)
+})
+
+
+def _mean_planet_longitude(jd, planet):
+    """Approximate tropical longitude from mean motion, 0.0 for unknown planets"""
+    motion = _MEAN_MOTION.get(planet)
+    if motion is None:
+        return 0.0
+    base, rate = motion
+    return (base + rate * (jd - 2451545.0)) % 360
+
+
+# Planets the enhanced engine has no perturbation model for
+_OUTER_PLANETS = ('uranus', 'neptune', 'pluto')
+
+# (planet, base, rate) rows for the outer planets, resolved once at import
+_OUTER_PLANET_MOTIONS = tuple((planet,) + _MEAN_MOTION[planet] for planet in _OUTER_PLANETS)
+
+
+def _mean_planet_longitudes(jd, motions=_OUTER_PLANET_MOTIONS):
+    """Mean-motion longitudes keyed by planet for (planet, base, rate) rows, days since J2000 computed once"""
+    days = jd - 2451545.0
+    return {planet: (base + rate * days) % 360 for planet, base, rate in motions}
+
+
+def _local_sidereal_degrees(jd, longitude):
+    """Local sidereal time in degrees for an east-positive longitude"""
+    T = (jd - 2451545.0) / 36525.0
+    theta0 = 280.46061837 + 360.98564736629 * (jd - 2451545.0) + 0.000387933 * T**2 - T**3 / 38710000.0
+    return (theta0 + longitude) % 360
+
+
+# cos/sin of the 30-degree steps between successive house cusps
+_COS_HOUSE_OFFSETS = tuple(math.cos(math.radians(i * 30)) for i in range(12))
+_SIN_HOUSE_OFFSETS = tuple(math.sin(math.radians(i * 30)) for i in range(12))
+
+
+def _house_cusp_longitudes(lst_degrees, latitude, system, ayanamsa_value=None):
+    """Twelve house cusp longitudes, sidereal when ayanamsa_value is given"""
+    if system == 'equal':
+        cusps = [(lst_degrees + i * 30) % 360 for i in range(12)]
+    elif system == 'whole':
+        ascendant_sign = int(lst_degrees // 30)
+        cusps = [((ascendant_sign + i) % 12) * 30 for i in range(12)]
+    else:  # Placidus approximation with latitude correction
+        # cos(lst + 30i) by angle addition, so only one sin/cos pair per chart
+        lat_factor = math.sin(math.radians(latitude)) * 3
+        lst_radians = math.radians(lst_degrees)
+        cos_lst = lat_factor * math.cos(lst_radians)
+        sin_lst = lat_factor * math.sin(lst_radians)
+        cusps = []
+        for i in range(12):
+            base_longitude = (i * 30 + lst_degrees) % 360
+            correction = cos_lst * _COS_HOUSE_OFFSETS[i] - sin_lst * _SIN_HOUSE_OFFSETS[i]
+            cusps.append((base_longitude + correction) % 360)
+    
+    # Apply ayanamsa correction if available (for sidereal houses)
+    if ayanamsa_value is not None:
+        cusps = [(cusp - ayanamsa_value) % 360 for cusp in cusps]
+    return cusps
+
+# Major aspects as (name, exact angle, orb); the enhanced engine uses tighter orbs
+_PRECISE_ASPECT_ORBS = (
+    ('conjunction', 0, 6),
+    ('opposition', 180, 6),
+    ('trine', 120, 5),
+    ('square', 90, 5),
+    ('sextile', 60, 3),
+)
+
+# Precise-aspect strength by orb: under 1 degree, under 3 degrees, otherwise
+_ASPECT_STRENGTHS = ('exact', 'close', 'wide')
+_ASPECT_STRENGTH_BOUNDS = (1.0, 3.0)
+
+_STANDARD_ASPECT_ORBS = (
+    ('conjunction', 0, 8),
+    ('opposition', 180, 8),
+    ('trine', 120, 6),
+    ('square', 90, 6),
+    ('sextile', 60, 4),
+)
+
+
+def _aspect_windows(aspect_orbs):
+    """
+    Index an orb table for bisect: (window lows, (high, name, angle) per window)
+    
+    Windows are sorted by angle and must not overlap, so a separation can
+    fall inside at most one of them.
+    """
+    windows = sorted((angle - orb, angle + orb, name, angle) for name, angle, orb in aspect_orbs)
+    for previous, current in zip(windows, windows[1:]):
+        if current[0] <= previous[1]:
+            raise ValueError(f"Aspect orbs overlap: {previous[2]} and {current[2]}")
+    return (tuple(low for low, _, _, _ in windows),
+            tuple((high, name, angle) for _, high, name, angle in windows))
+
+
+_PRECISE_ASPECT_WINDOWS = _aspect_windows(_PRECISE_ASPECT_ORBS)
+_STANDARD_ASPECT_WINDOWS = _aspect_windows(_STANDARD_ASPECT_ORBS)
+
+
+def _aspect_hits(longitudes, aspect_windows):
+    """
+    Find every planet pair within orb of a major aspect
+    
+    longitudes holds one entry per planet (None to skip it) and
+    aspect_windows comes from _aspect_windows. Returns (i, j, aspect name,
+    orb) tuples with i < j, in pair order.
+    """
+    lows, windows = aspect_windows
+    find_window = bisect.bisect_right
+    hits = []
+    count = len(longitudes)
+    for i in range(count - 1):
+        lon1 = longitudes[i]
+        if lon1 is None:
+            continue
+        for j in range(i + 1, count):
+            lon2 = longitudes[j]
+            if lon2 is None:
+                continue
+            
+            # Angular separation folded into [0, 180]
+            separation = abs(lon1 - lon2)
+            if separation > 180:
+                separation = 360 - separation
+            
+            # Only the window starting at or below the separation can contain it
+            index = find_window(lows, separation) - 1
+            if index >= 0:
+                high, aspect_name, exact_angle = windows[index]
+                if separation <= high:
+                    hits.append((i, j, aspect_name, abs(separation - exact_angle)))
+    return hits
+
+# Optional offline gazetteer in GeoNames dump format (e.g. cities500.txt.gz from
+# download.geonames.org), checked before Nominatim when the file is present
+_GAZETTEER_PATH = os.environ.get(
+    'ASTRO_CITIES_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cities500.txt.gz'))
+
+_gazetteer = None
+_gazetteer_lock = threading.Lock()
+
+
+def _city_words(city_name):
+    """Words of a place name with accents, case and commas dropped"""
+    decomposed = unicodedata.normalize('NFKD', city_name)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower().replace(',', ' ').split()
+
+
+def _leading_match(table, words):
+    """Entry for the longest leading run of words found in table, or None"""
+    for end in range(len(words), 0, -1):
+        entry = table.get(' '.join(words[:end]))
+        if entry is not None:
+            return entry
+    return None
+
+
+def _load_gazetteer(path):
+    """
+    Map normalized city name -> (lat, lon, 'Name, CC'), most populous city winning
+    
+    Malformed rows are skipped and counted rather than failing the file.
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    best = {}
+    skipped = 0
+    with opener(path, 'rt', encoding='utf-8') as rows:
+        for row in rows:
+            fields = row.split('\t')
+            try:
+                population = int(fields[14] or 0)
+                entry = (float(fields[4]), float(fields[5]), f"{fields[1]}, {fields[8]}")
+            except (IndexError, ValueError):
+                skipped += 1
+                continue
+            for name in {' '.join(_city_words(fields[1])), ' '.join(_city_words(fields[2]))}:
+                current = best.get(name)
+                if current is None or population > current[0]:
+                    best[name] = (population, entry)
+    if skipped:
+        print(f"Gazetteer {path}: skipped {skipped} malformed rows")
+    return {name: entry for name, (_, entry) in best.items()}
+
+
+def _gazetteer_lookup(city_name):
+    """
+    Offline (lat, lon, name) for a free-form city name, or None
+    
+    Names are normalized and matched like _fallback_coordinates, so
+    'Paris, France' finds 'paris'.
+    """
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                try:
+                    _gazetteer = _load_gazetteer(_GAZETTEER_PATH)
+                except (OSError, ValueError):
+                    _gazetteer = {}
+    return _leading_match(_gazetteer, _city_words(city_name))
+
+# Offline coordinates used when Nominatim is unavailable
+_CITY_COORDS = MappingProxyType({
+    'new york': (40.7128, -74.0060, 'New York, NY, USA'),
+    'london': (51.5074, -0.1278, 'London, UK'),
+    'paris': (48.8566, 2.3522, 'Paris, France'),
+    'tokyo': (35.6762, 139.6503, 'Tokyo, Japan'),
+    'mumbai': (19.0760, 72.8777, 'Mumbai, India'),
+    'delhi': (28.7041, 77.1025, 'New Delhi, India'),
+    'sydney': (-33.8688, 151.2093, 'Sydney, Australia'),
+    'patna': (25.5941, 85.1376, 'Patna, Bihar, India'),
+    'kolkata': (22.5726, 88.3639, 'Kolkata, West Bengal, India'),
+})
+
+
+def _fallback_coordinates(city_name):
+    """
+    Offline (lat, lon, name) for a free-form city name, or None
+    
+    Accents, case, commas and extra spaces are ignored, and the longest
+    leading run of words found in _CITY_COORDS wins, so 'New York City'
+    and 'Paris, France' resolve like 'new york' and 'paris'.
+    """
+    return _leading_match(_CITY_COORDS, _city_words(city_name))
+
+# Sun-sign interpretation texts, one record per sign, built once at import
+_SignInfo = namedtuple('_SignInfo', 'essence career love health finances parenting spiritual communication travel growth')
+
+_SIGN_INFO = MappingProxyType({
+    'Aries': _SignInfo(
+        essence="You possess a pioneering spirit that naturally drives you to lead and initiate new ventures. Your confidence and courage inspire others to follow your vision, though practicing patience when others don't match your energetic pace enhances your leadership effectiveness.",
+        career="Your natural leadership and pioneering spirit excel in entrepreneurship, emergency services, competitive sports, or any field where you can be first to market. You thrive when taking charge of challenging projects and inspiring teams through decisive action.",
+        love="In love, you bring passion, excitement, and unwavering loyalty. You love with your whole heart and appreciate partners who can match your enthusiasm for life while respecting your need for independence.",
+        health="Your dynamic energy needs regular physical outlets. High-intensity exercise, competitive sports, or martial arts help you release stress. Pay attention to head-related issues and manage stress levels.",
+        finances="Your entrepreneurial spirit and calculated risk-taking can lead to significant gains. You spot opportunities quickly, though patience with long-term investments balances impulsive tendencies.",
+        parenting="You encourage independence and courage in children, teaching them to be strong and pursue goals fearlessly.",
+        spiritual="Your spiritual path involves balancing pioneering spirit with patience. You grow through leadership in spiritual communities and courageous service.",
+        communication="You communicate with directness and enthusiasm, preferring quick conversations. You learn best through hands-on experience and express ideas with motivating energy.",
+        travel="You love adventure travel that challenges you physically and mentally. You prefer independent travel where you can make spontaneous decisions.",
+        growth="Your challenge is learning patience while maintaining natural leadership. Growth comes through developing diplomatic skills and understanding that true leadership serves others' highest good."
+    ),
+    'Taurus': _SignInfo(
+        essence="You bring remarkable stability and practical wisdom to every situation. Your persistence and reliability make you someone others truly depend on, though developing flexibility helps you adapt gracefully when circumstances require change.",
+        career="Your patience and eye for quality suit careers in finance, real estate, agriculture, luxury goods, or artisanal crafts. You excel at building lasting value and creating systems others depend on for security.",
+        love="You offer steady, devoted love and create beautiful, comfortable shared spaces. You show love through practical actions and prefer stable, long-term commitments over casual dating.",
+        health="Your steady constitution benefits from consistent, moderate exercise and attention to nutrition. Walking, yoga, or gardening suit your nature. Watch throat and weight-related concerns.",
+        finances="Your natural financial instincts and patience make you excellent at building substantial wealth over time. You appreciate quality investments and tangible assets.",
+        parenting="You provide stability and security, teaching children patience and appreciation for life's simple pleasures.",
+        spiritual="Your spiritual development comes through connecting with nature and finding sacred meaning in life's simple pleasures.",
+        communication="You communicate thoughtfully and deliberately, preferring substantial conversations. You learn through practical application and express ideas emphasizing real-world value.",
+        travel="You enjoy comfortable, scenic travel to beautiful destinations with good food and luxury accommodations.",
+        growth="Your challenge is developing flexibility while maintaining stability. Growth comes through learning when to adapt and finding balance between security and necessary evolution."
+    ),
+    'Gemini': _SignInfo(
+        essence="Your quick wit and insatiable curiosity make you an excellent communicator and natural networker. You thrive on mental stimulation and variety, though focusing on depth rather than breadth can deepen your impact.",
+        career="Your communication skills and versatility shine in media, education, sales, technology, or journalism. You excel at connecting people and ideas, making complex information accessible.",
+        love="You bring playfulness and intellectual stimulation to relationships. You need mental connection as much as emotional intimacy and appreciate partners who engage with your ideas.",
+        health="Your active mind needs variety in fitness routines. Team sports, dance, or activities combining learning with movement work well. Pay attention to nervous system and respiratory health.",
+        finances="Your versatility creates opportunities for diverse income sources. You excel at finding profitable information, though focusing on fewer investments may yield better returns.",
+        parenting="You stimulate curiosity and communication, creating environments rich in learning and exploration.",
+        spiritual="Your spiritual journey involves synthesizing diverse wisdom traditions and sharing insights through teaching or writing.",
+        communication="You're a natural communicator who enjoys exploring ideas through conversation. You learn quickly through varied experiences and explain complex concepts accessibly.",
+        travel="You love variety in travel, preferring trips offering multiple experiences and learning opportunities.",
+        growth="Your challenge is developing depth while maintaining curiosity. Growth comes through choosing meaningful commitments and learning to complete projects before moving to new interests."
+    ),
+    'Cancer': _SignInfo(
+        essence="Your intuitive nature and emotional intelligence help you nurture others with remarkable sensitivity. You create safe spaces where people can heal and grow, though healthy boundaries protect your energy.",
+        career="Your nurturing abilities make you exceptional in healthcare, hospitality, real estate, counseling, or childcare. You create environments where others feel safe and supported.",
+        love="You nurture your loved ones with deep emotional care and intuitive understanding. You create a sense of home and family wherever you are, offering emotional security.",
+        health="Your sensitive system benefits from gentle, nurturing approaches. Swimming, walking, or home-based routines suit you. Watch digestive and emotional eating patterns.",
+        finances="Your intuitive approach and focus on security lead to emotionally satisfying financial choices. You excel at saving for family needs and long-term security.",
+        parenting="You nurture emotional development and create deep family bonds through caring attention.",
+        spiritual="Your spiritual path centers on developing healing abilities and creating nurturing communities where others can grow.",
+        communication="You communicate with emotional intelligence and intuitive understanding. You learn best in supportive environments and express ideas creating connection.",
+        travel="You prefer travel that feels emotionally meaningful and connects you with family heritage or nurturing experiences.",
+        growth="Your challenge is setting boundaries while maintaining nurturing nature. Growth comes through learning to care for yourself and recognizing when helping becomes enabling."
+    ),
+    'Leo': _SignInfo(
+        essence="Your natural charisma and creative spirit light up any room. You inspire through authentic self-expression and generous leadership, though sharing the spotlight enhances your own radiance.",
+        career="Your creativity and natural charisma suit entertainment, education, luxury retail, management, or any role where you can inspire and showcase talent.",
+        love="You bring warmth, generosity, and romantic flair to relationships. You love to celebrate your partner and create memorable experiences together.",
+        health="Your vital energy shines when you enjoy your fitness routine. Dance, performance-based fitness, or heart-healthy activities align with your nature.",
+        finances="Your confidence can attract wealth through creative ventures and high-visibility opportunities. Balance generous spending with consistent saving.",
+        parenting="You encourage self-expression and creativity, helping children develop confidence in their talents.",
+        spiritual="Your spiritual development involves expressing authentic self while serving something greater than personal recognition.",
+        communication="You communicate with warmth and engaging flair. You learn through creative expression and naturally explain ideas in inspiring ways.",
+        travel="You enjoy glamorous travel to exciting destinations where you can experience luxury and entertainment.",
+        growth="Your challenge is sharing attention while maintaining confidence. Growth comes through learning that true leadership elevates others and your light shines brighter helping others discover their brilliance."
+    ),
+    'Virgo': _SignInfo(
+        essence="Your attention to detail and desire to serve creates meaningful improvements everywhere you go. Your analytical mind solves complex problems, though self-compassion balances perfectionism.",
+        career="Your analytical skills excel in healthcare, research, quality control, editing, or technical fields. You improve systems and solve problems with methodical precision.",
+        love="You show love through thoughtful actions and genuine care for your partner's wellbeing. You pay attention to details that matter and work to improve relationships.",
+        health="Your methodical approach serves you well with detailed wellness routines. Precise programs and nutrition tracking suit your systematic nature.",
+        finances="Your analytical skills make you excellent at budgeting and finding undervalued opportunities. You prefer conservative, well-researched investments.",
+        parenting="You teach practical skills and attention to detail, helping children develop good habits.",
+        spiritual="Your spiritual path involves finding perfection through humble service and attention to life's sacred details.",
+        communication="You communicate with precision and helpful detail. You learn through systematic study and organize complex information usefully.",
+        travel="You prefer well-organized travel with detailed itineraries and practical benefits like health retreats or educational tours.",
+        growth="Your challenge is accepting imperfection while maintaining excellence. Growth comes through learning 'good enough' is often sufficient and perfectionism can prevent completing important work."
+    ),
+    'Libra': _SignInfo(
+        essence="Your diplomatic nature brings harmony to relationships and beauty to environments. You excel at seeing multiple perspectives, though trusting your own judgment strengthens decision-making.",
+        career="Your diplomatic skills suit law, counseling, design, mediation, or partnership-based businesses. You create harmony and find solutions that benefit everyone.",
+        love="You bring harmony, romance, and diplomatic grace to partnerships. You naturally seek balance and work to create relationships where both feel valued.",
+        health="Your love of beauty draws you to aesthetically pleasing fitness activities. Partner workouts or activities in beautiful settings motivate you.",
+        finances="Your diplomatic skills can create wealth through partnerships or beauty-related businesses. You appreciate balanced investment portfolios.",
+        parenting="You teach fairness and diplomacy, helping children appreciate beauty and harmony.",
+        spiritual="Your spiritual journey involves creating harmony and justice through diplomatic service and mediation.",
+        communication="You communicate diplomatically, always considering others' perspectives. You learn through discussion and present ideas in balanced ways.",
+        travel="You love romantic or aesthetically beautiful destinations offering cultural refinement and harmonious experiences.",
+        growth="Your challenge is making independent decisions while maintaining diplomacy. Growth comes through trusting your judgment and understanding some conflict is necessary for authentic relationships."
+    ),
+    'Scorpio': _SignInfo(
+        essence="Your emotional depth and transformative power help others heal profoundly. You see beneath surfaces to essential truths, though vulnerability deepens your connections.",
+        career="Your investigative nature suits psychology, research, finance, healing arts, or transformation-focused careers. You help others navigate profound changes.",
+        love="You offer intense, transformative love that goes beyond surface attraction. You seek deep emotional connection and are fiercely loyal once committed.",
+        health="Your intense nature benefits from transformative, challenging routines. Intense training or healing arts suit your depth.",
+        finances="Your strategic thinking can uncover hidden opportunities and lead to wealth transformation. You excel at long-term financial planning.",
+        parenting="You encourage emotional honesty and depth, helping children understand life's complexities.",
+        spiritual="Your spiritual path involves deep transformation and helping others heal from life's wounds.",
+        communication="You communicate with intensity and depth, preferring meaningful conversations. You learn through investigation and express ideas revealing hidden truths.",
+        travel="You're drawn to transformative travel experiences offering depth and mystery like spiritual retreats or archaeological sites.",
+        growth="Your challenge is learning to trust while maintaining strength. Growth comes through understanding true power includes courage to be open and healing requires both strength and gentleness."
+    ),
+    'Sagittarius': _SignInfo(
+        essence="Your philosophical nature and love of adventure expands minds and opens possibilities. You inspire others to think bigger, though grounding visions makes them reality.",
+        career="Your love of learning suits education, travel, publishing, law, or international business. You expand others' horizons through teaching and cultural exchange.",
+        love="You bring adventure, optimism, and philosophical depth to relationships. You need freedom to explore within partnership and inspire growth.",
+        health="Your adventurous spirit thrives with outdoor activities and varied fitness experiences. Hiking or adventure sports motivate you.",
+        finances="Your optimistic nature can create wealth through international or education-related ventures. Ground expansive visions with practical planning.",
+        parenting="You inspire adventure and learning, encouraging children to explore and question.",
+        spiritual="Your spiritual development comes through exploring wisdom traditions and sharing philosophical insights.",
+        communication="You communicate enthusiasm for big ideas and philosophical concepts. You learn through exploration and explain concepts broadening perspectives.",
+        travel="You're the natural traveler, loving international adventures that expand your philosophical understanding of different cultures.",
+        growth="Your challenge is developing commitment while maintaining freedom. Growth comes through learning depth enhances adventures and understanding that promises matter."
+    ),
+    'Capricorn': _SignInfo(
+        essence="Your discipline and long-term vision create lasting achievements. You build things that endure through challenge, though celebrating progress sustains motivation.",
+        career="Your discipline and ambition suit business leadership, government, engineering, or traditional professional fields. You build lasting institutions.",
+        love="You build relationships with care and long-term vision. You show love through commitment and working toward shared goals.",
+        health="Your disciplined approach creates lasting wellness habits through consistent, goal-oriented routines. Structured programs suit your determination.",
+        finances="Your disciplined approach naturally builds substantial wealth through consistent saving and strategic investments.",
+        parenting="You teach responsibility and goal-setting, helping children build character through achievement.",
+        spiritual="Your spiritual path involves building lasting structures for spiritual purposes through disciplined practice.",
+        communication="You communicate with authority and practical wisdom. You learn through structured study and present ideas emphasizing long-term benefits.",
+        travel="You prefer travel offering educational value and contributing to long-term goals like business or historical sites.",
+        growth="Your challenge is balancing achievement with enjoyment while maintaining discipline. Growth comes through celebrating progress and understanding success includes happiness, not just accomplishment."
+    ),
+    'Aquarius': _SignInfo(
+        essence="Your innovative thinking and humanitarian spirit advance society toward a better future. You see possibilities others miss, though emotional connection strengthens impact.",
+        career="Your innovative thinking suits technology, humanitarian work, research, or progressive causes. You advance society through breakthrough ideas.",
+        love="You bring unique perspectives and humanitarian values to relationships. You need intellectual connection and appreciate partners who share your ideals.",
+        health="Your innovative nature enjoys unique, technology-enhanced, or group fitness activities. Progressive approaches appeal to you.",
+        finances="Your innovative thinking can create wealth through technology or progressive investments aligned with your values.",
+        parenting="You encourage individuality and social awareness, helping children think independently.",
+        spiritual="Your spiritual journey involves humanitarian causes that advance consciousness for all humanity.",
+        communication="You communicate innovative ideas challenging conventional thinking. You learn through experimentation and inspire others to consider new possibilities.",
+        travel="You enjoy unique, unconventional travel experiences most people wouldn't consider, including humanitarian travel.",
+        growth="Your challenge is connecting emotionally while maintaining objectivity. Growth comes through learning personal relationships enhance your ability to serve humanity's evolution."
+    ),
+    'Pisces': _SignInfo(
+        essence="Your compassion and imagination heal and inspire everyone you encounter. You understand life's deeper meanings, though healthy boundaries preserve your sensitive energy.",
+        career="Your creativity and compassion suit arts, healing professions, spirituality, or charitable work. You bring inspiration and emotional healing to your work.",
+        love="You love with boundless compassion and intuitive understanding. You bring creativity, spirituality, and emotional healing to relationships.",
+        health="Your sensitive system responds well to gentle, flowing movement and water-based activities. Swimming, yoga, or tai chi suit your nature.",
+        finances="Your intuitive nature influences financial choices toward personally meaningful investments. Balance generosity with practical money management.",
+        parenting="You nurture creativity and compassion, helping children develop emotional intelligence.",
+        spiritual="Your spiritual path is naturally mystical, involving direct divine connection and selfless service.",
+        communication="You communicate with empathy and intuitive understanding. You learn through immersion and explain ideas helping others feel emotional truth.",
+        travel="You prefer spiritual or artistic travel nourishing your soul, drawn to mystical destinations or places near water.",
+        growth="Your challenge is developing boundaries while maintaining compassion. Growth comes through learning self-care enables you to serve others more effectively."
+    ),
+})
+
+# Signs every interpret_* method reads, resolved once per report
+_ChartSigns = namedtuple('_ChartSigns', 'sun moon rising mercury sun_info')
+
+
+def _chart_signs(chart_data):
+    """Resolve the interpretation signs of a chart, with the report's defaults"""
+    sun_sign = chart_data.get('sun_sign', 'Aries')
+    # Fall back to the Sun sign only when Mercury has no sign
+    mercury = chart_data.get('planets', {}).get('mercury')
+    mercury_sign = mercury['sign'] if mercury and 'sign' in mercury else sun_sign
+    return _ChartSigns(sun_sign, chart_data.get('moon_sign', 'Cancer'),
+                       chart_data.get('ascendant', 'Leo'), mercury_sign, _SIGN_INFO.get(sun_sign))
+
+
+def _copy_tree(value):
+    """Copy nested dicts and lists, sharing the immutable leaves"""
+    if type(value) is dict:
+        return {key: _copy_tree(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_tree(item) for item in value]
+    return value
+
+
+def _finite_or_none(value):
+    """Copy of nested dicts, lists and tuples with NaN and infinities replaced by None, as orjson writes them"""
+    if type(value) is float:
+        return value if math.isfinite(value) else None
+    if type(value) is dict:
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if type(value) in (list, tuple):
+        return [_finite_or_none(item) for item in value]
+    return value
+
+
+class ChartResult:
+    """
+    Compact record of a finished chart, as held in the chart cache
+    
+    The bulky parts are slots and the remaining summary fields (signs,
+    calculation method, ...) are one tuple of (key, value) pairs.
+    to_dict() rebuilds the plain dict that routes, templates and jsonify
+    expect; comprehensive_interpretations is None when none were made.
+    Both directions copy the nested dicts and lists, so callers may
+    mutate the charts they get without touching the cached record.
+    """
+    
+    __slots__ = ('planets', 'houses', 'aspects', 'summary', 'comprehensive_interpretations')
+    
+    def __init__(self, planets, houses, aspects, summary, comprehensive_interpretations=None):
+        self.planets = planets
+        self.houses = houses
+        self.aspects = aspects
+        self.summary = summary
+        self.comprehensive_interpretations = comprehensive_interpretations
+    
+    @classmethod
+    def from_dict(cls, chart_data):
+        summary = tuple((key, value) for key, value in chart_data.items()
+                        if key not in cls.__slots__)
+        return cls(_copy_tree(chart_data['planets']), _copy_tree(chart_data['houses']),
+                   _copy_tree(chart_data['aspects']), summary,
+                   _copy_tree(chart_data.get('comprehensive_interpretations')))
+    
+    def to_dict(self):
+        chart_data = {'planets': _copy_tree(self.planets), 'houses': _copy_tree(self.houses),
+                      'aspects': _copy_tree(self.aspects)}
+        chart_data.update(self.summary)
+        if self.comprehensive_interpretations is not None:
+            chart_data['comprehensive_interpretations'] = _copy_tree(self.comprehensive_interpretations)
+        return chart_data
+
+
 class ProfessionalAstrologyEngine:
     """Professional-grade astrology calculations with enhanced precision"""
     
-    PLANETS = {
+    # Engines are built per request; all shared state lives on the class
+    __slots__ = ('ayanamsa_system', 'enhanced_engine', 'precision_mode')
+    
+    # Shared lookup tables are read-only views so no caller can mutate them
+    PLANETS = MappingProxyType({
         'sun': 'Sun',
         'moon': 'Moon', 
         'mercury': 'Mercury',
@@ -22,19 +539,58 @@ class ProfessionalAstrologyEngine:
         'uranus': 'Uranus',
         'neptune': 'Neptune',
         'pluto': 'Pluto'
-    }
+    })
     
-    ZODIAC_SIGNS = [
-        'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-        'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
-    ]
+    ZODIAC_SIGNS = _ZODIAC_SIGNS
     
-    HOUSE_SYSTEMS = {
+    HOUSE_SYSTEMS = MappingProxyType({
         'placidus': 'Placidus',
         'koch': 'Koch',
         'equal': 'Equal House',
         'whole': 'Whole Sign'
-    }
+    })
+    
+    # Interpretation section key -> interpret_* method, in report order
+    INTERPRETATION_SECTIONS = (
+        ('personality_core', 'interpret_personality_core'),
+        ('career_profession', 'interpret_career_profession'),
+        ('relationships_love', 'interpret_relationships_love'),
+        ('health_vitality', 'interpret_health_vitality'),
+        ('finances_wealth', 'interpret_finances_wealth'),
+        ('family_children', 'interpret_family_children'),
+        ('spiritual_growth', 'interpret_spiritual_growth'),
+        ('communication_learning', 'interpret_communication_learning'),
+        ('travel_adventure', 'interpret_travel_adventure'),
+        ('challenges_lessons', 'interpret_challenges_lessons'),
+    )
+    
+    # Finished charts shared by all engines, least recently used evicted first
+    CHART_CACHE_SIZE = 1024
+    _chart_cache = OrderedDict()
+    _chart_cache_lock = threading.Lock()
+    
+    # AstrologyCalculator holds no state, so one instance serves every engine
+    _std_calc = AstrologyCalculator()
+    
+    # One EnhancedBaseEngine per ayanamsa system, shared by all engines
+    _enhanced_engines = {}
+    _enhanced_engines_lock = threading.Lock()
+    
+    @classmethod
+    def _get_enhanced_engine(cls, ayanamsa_system):
+        """Return the shared EnhancedBaseEngine for an ayanamsa system"""
+        engine = cls._enhanced_engines.get(ayanamsa_system)
+        if engine is None:
+            with cls._enhanced_engines_lock:
+                engine = cls._enhanced_engines.get(ayanamsa_system)
+                if engine is None:
+                    engine = EnhancedBaseEngine({
+                        'precision': 'HIGH',
+                        'enable_logging': False,  # Disable logging for production
+                        'ayanamsa_system': ayanamsa_system
+                    })
+                    cls._enhanced_engines[ayanamsa_system] = engine
+        return engine
     
     def __init__(self, ayanamsa_system='LAHIRI'):
         """Initialize with enhanced precision engine"""
@@ -42,85 +598,79 @@ class ProfessionalAstrologyEngine:
         
         # Initialize enhanced engine if available
         if ENHANCED_ENGINE_AVAILABLE:
-            self.enhanced_engine = EnhancedBaseEngine({
-                'precision': 'HIGH',
-                'enable_logging': False,  # Disable logging for production
-                'ayanamsa_system': ayanamsa_system
-            })
+            self.enhanced_engine = self._get_enhanced_engine(ayanamsa_system)
             self.precision_mode = 'ENHANCED'
         else:
             self.enhanced_engine = None
             self.precision_mode = 'STANDARD'
-        
-        # Keep existing ephemeris initialization for fallback
-        self.eph = None
-        self.ts = None
-        self.ephemeris_available = False
-        
-        try:
-            from skyfield.api import load
-            self.ts = load.timescale()
-            self.eph = load('de421_excerpt.bsp')
-            self.ephemeris_available = True
-        except Exception:
-            self.ephemeris_available = False
+    
+    # Skyfield fallback ephemeris, loaded on first access and shared by all engines
+    @property
+    def ts(self):
+        return _load_ephemeris()[0]
+    
+    @property
+    def eph(self):
+        return _load_ephemeris()[1]
+    
+    @property
+    def ephemeris_available(self):
+        return _load_ephemeris()[1] is not None
     
     def get_coordinates_for_city(self, city_name):
-        """Get coordinates for any city worldwide using Nominatim"""
-        import requests
+        """
+        Get coordinates for any city worldwide
         
+        The offline gazetteer is consulted first when installed; otherwise
+        Nominatim is queried (cached in memory and on disk).
+        """
+        city_key = city_name.lower().strip()
+        local = _gazetteer_lookup(city_name)
+        if local is not None:
+            return local
         try:
-            url = "https://nominatim.openstreetmap.org/search"
-            params = {
-                'q': city_name,
-                'format': 'json',
-                'limit': 1,
-                'addressdetails': 1
-            }
-            
-            headers = {
-                'User-Agent': 'AstroApp-Professional/2.0 (astrology software)'
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    result = data[0]
-                    lat = float(result['lat'])
-                    lon = float(result['lon'])
-                    
-                    display_name = result.get('display_name', city_name)
-                    location_parts = display_name.split(', ')[:3]
-                    clean_name = ', '.join(location_parts)
-                    
-                    return (lat, lon, clean_name)
-            
-            return self._fallback_city_lookup(city_name)
-            
+            return geocode_city(city_key)
         except Exception:
             return self._fallback_city_lookup(city_name)
     
+    def get_coordinates_for_cities(self, city_names):
+        """
+        Get coordinates for several cities as {city_name: (lat, lon, clean_name)}
+        
+        Repeated names are resolved once, and only names missing from the
+        gazetteer and geocode caches reach Nominatim. Those requests go out
+        one at a time over the shared session, because the public service
+        allows at most one request per second.
+        """
+        return {city_name: self.get_coordinates_for_city(city_name)
+                for city_name in dict.fromkeys(city_names)}
+    
     def _fallback_city_lookup(self, city_name):
         """Fallback to local city database"""
-        city_coords = {
-            'new york': (40.7128, -74.0060, 'New York, NY, USA'),
-            'london': (51.5074, -0.1278, 'London, UK'),
-            'paris': (48.8566, 2.3522, 'Paris, France'),
-            'tokyo': (35.6762, 139.6503, 'Tokyo, Japan'),
-            'mumbai': (19.0760, 72.8777, 'Mumbai, India'),
-            'delhi': (28.7041, 77.1025, 'New Delhi, India'),
-            'sydney': (-33.8688, 151.2093, 'Sydney, Australia'),
-            'patna': (25.5941, 85.1376, 'Patna, Bihar, India'),
-            'kolkata': (22.5726, 88.3639, 'Kolkata, West Bengal, India'),
-        }
-        
-        city_key = city_name.lower().strip()
-        return city_coords.get(city_key, (0.0, 0.0, f'{city_name} (coordinates needed)'))
+        coords = _fallback_coordinates(city_name)
+        if coords is None:
+            return (0.0, 0.0, f'{city_name} (coordinates needed)')
+        return coords
     
-    def calculate_professional_chart(self, birth_datetime, latitude, longitude, house_system='placidus'):
-        """Calculate comprehensive birth chart with enhanced precision"""
+    def calculate_professional_chart(self, birth_datetime, latitude, longitude, house_system='placidus',
+                                     include_interpretations=True, interpretation_sections=None):
+        """
+        Calculate comprehensive birth chart with enhanced precision
+        
+        With include_interpretations=False the chart carries positions only
+        and no 'comprehensive_interpretations'; interpretation_sections
+        limits the report to the given INTERPRETATION_SECTIONS keys.
+        
+        Charts are cached as ChartResult records by engine settings, birth
+        time, coordinates rounded to 6 decimals and the requested sections.
+        Each call returns its own copy, nested planets, houses and
+        interpretations included.
+        """
+        cache_key, sections = self._chart_cache_key(birth_datetime, latitude, longitude, house_system,
+                                                    include_interpretations, interpretation_sections)
+        cached = self._cached_chart(cache_key)
+        if cached is not None:
+            return cached
         
         # Get base chart data using your existing methods
         if self.precision_mode == 'ENHANCED':
@@ -129,57 +679,108 @@ class ProfessionalAstrologyEngine:
             chart_data = self._standard_calculation(birth_datetime, latitude, longitude, house_system)
         
         # Add comprehensive interpretations
-        chart_data['comprehensive_interpretations'] = self.generate_comprehensive_interpretation(chart_data)
+        if sections is None or sections:
+            chart_data['comprehensive_interpretations'] = self.generate_comprehensive_interpretation(chart_data, sections)
         
+        self._store_chart(cache_key, chart_data)
         return chart_data
     
+    def _chart_cache_key(self, birth_datetime, latitude, longitude, house_system='placidus',
+                         include_interpretations=True, interpretation_sections=None):
+        """(chart cache key, requested sections) for calculate_professional_chart arguments"""
+        if not include_interpretations:
+            sections = frozenset()
+        elif interpretation_sections is None:
+            sections = None
+        else:
+            sections = frozenset(interpretation_sections)
+        
+        cache_key = (self.precision_mode, self.ayanamsa_system, birth_datetime.isoformat(),
+                     round(float(latitude), 6), round(float(longitude), 6), house_system, sections)
+        return cache_key, sections
+    
+    def _cached_chart(self, cache_key):
+        """A fresh chart dict from the chart cache, or None"""
+        cache = self._chart_cache
+        with self._chart_cache_lock:
+            cached = cache.get(cache_key)
+            if cached is None:
+                return None
+            cache.move_to_end(cache_key)
+        return cached.to_dict()
+    
+    def _store_chart(self, cache_key, chart_data):
+        cache = self._chart_cache
+        with self._chart_cache_lock:
+            cache[cache_key] = ChartResult.from_dict(chart_data)
+            if len(cache) > self.CHART_CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    def calculate_professional_charts_batch(self, requests_list):
+        """
+        Calculate many charts in this process, sharing the chart cache
+        
+        Each request is a tuple of calculate_professional_chart positional
+        arguments, from (birth_datetime, latitude, longitude) up to
+        interpretation_sections. A chart takes ~70us, so worker processes
+        would cost more to start and feed than they save on any batch the
+        app accepts. Results are returned in input order.
+        """
+        return [self.calculate_professional_chart(*request) for request in requests_list]
+    
+    def to_json(self, payload):
+        """
+        Serialize a chart (or a response wrapping one) to a compact JSON string
+        
+        orjson and the json fallback encode the same data: UTF-8 rather
+        than escapes, no spaces, str() for datetimes and other values JSON
+        has no type for, and null for NaN and infinities. The text differs
+        only in exponent floats, which orjson writes as 1e-7 and json as
+        1e-07.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(payload, default=str,
+                                option=orjson.OPT_PASSTHROUGH_DATETIME).decode('utf-8')
+        return json.dumps(_finite_or_none(payload), ensure_ascii=False, separators=(',', ':'),
+                          default=str, allow_nan=False)
+    
     # ========== COMPREHENSIVE INTERPRETATION SYSTEM ==========
     
-    def generate_comprehensive_interpretation(self, chart_data):
-        """Generate detailed interpretations across all major life aspects"""
-        
-        interpretations = {
-            'personality_core': self.interpret_personality_core(chart_data),
-            'career_profession': self.interpret_career_profession(chart_data),
-            'relationships_love': self.interpret_relationships_love(chart_data),
-            'health_vitality': self.interpret_health_vitality(chart_data),
-            'finances_wealth': self.interpret_finances_wealth(chart_data),
-            'family_children': self.interpret_family_children(chart_data),
-            'spiritual_growth': self.interpret_spiritual_growth(chart_data),
-            'communication_learning': self.interpret_communication_learning(chart_data),
-            'travel_adventure': self.interpret_travel_adventure(chart_data),
-            'challenges_lessons': self.interpret_challenges_lessons(chart_data)
-        }
+    def generate_comprehensive_interpretation(self, chart_data, sections=None):
+        """
+        Generate detailed interpretations across all major life aspects
+        
+        sections optionally limits the report to a subset of
+        INTERPRETATION_SECTIONS keys; only those interpret_* methods run.
+        Every call builds a fresh report, which costs less than copying a
+        cached one would.
+        """
+        signs = _chart_signs(chart_data)
+        if sections is None:
+            return {key: getattr(self, method)(chart_data, signs)
+                    for key, method in self.INTERPRETATION_SECTIONS}
         
-        return interpretations
+        unknown = set(sections).difference(key for key, _ in self.INTERPRETATION_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown interpretation sections: {', '.join(sorted(unknown))}")
+        return {key: getattr(self, method)(chart_data, signs)
+                for key, method in self.INTERPRETATION_SECTIONS if key in sections}
     
-    def interpret_personality_core(self, chart_data):
+    def interpret_personality_core(self, chart_data, signs=None):
         """Comprehensive personality analysis"""
-        sun_sign = chart_data.get('sun_sign', 'Aries')
-        moon_sign = chart_data.get('moon_sign', 'Cancer')
-        rising_sign = chart_data.get('ascendant', 'Leo')
-        
-        sun_descriptions = {
-            'Aries': "You possess a pioneering spirit that naturally drives you to lead and initiate new ventures. Your confidence and courage inspire others to follow your vision, though practicing patience when others don't match your energetic pace enhances your leadership effectiveness.",
-            'Taurus': "You bring remarkable stability and practical wisdom to every situation. Your persistence and reliability make you someone others truly depend on, though developing flexibility helps you adapt gracefully when circumstances require change.",
-            'Gemini': "Your quick wit and insatiable curiosity make you an excellent communicator and natural networker. You thrive on mental stimulation and variety, though focusing on depth rather than breadth can deepen your impact.",
-            'Cancer': "Your intuitive nature and emotional intelligence help you nurture others with remarkable sensitivity. You create safe spaces where people can heal and grow, though healthy boundaries protect your energy.",
-            'Leo': "Your natural charisma and creative spirit light up any room. You inspire through authentic self-expression and generous leadership, though sharing the spotlight enhances your own radiance.",
-            'Virgo': "Your attention to detail and desire to serve creates meaningful improvements everywhere you go. Your analytical mind solves complex problems, though self-compassion balances perfectionism.",
-            'Libra': "Your diplomatic nature brings harmony to relationships and beauty to environments. You excel at seeing multiple perspectives, though trusting your own judgment strengthens decision-making.",
-            'Scorpio': "Your emotional depth and transformative power help others heal profoundly. You see beneath surfaces to essential truths, though vulnerability deepens your connections.",
-            'Sagittarius': "Your philosophical nature and love of adventure expands minds and opens possibilities. You inspire others to think bigger, though grounding visions makes them reality.",
-            'Capricorn': "Your discipline and long-term vision create lasting achievements. You build things that endure through challenge, though celebrating progress sustains motivation.",
-            'Aquarius': "Your innovative thinking and humanitarian spirit advance society toward a better future. You see possibilities others miss, though emotional connection strengthens impact.",
-            'Pisces': "Your compassion and imagination heal and inspire everyone you encounter. You understand life's deeper meanings, though healthy boundaries preserve your sensitive energy."
-        }
+        signs = signs or _chart_signs(chart_data)
+        sun_sign = signs.sun
+        moon_sign = signs.moon
+        rising_sign = signs.rising
+        
+        sun_info = signs.sun_info
         
         return {
             'title': 'Your Core Personality & Life Purpose',
             'sections': {
                 'essential_self': {
                     'heading': f'Your Sun in {sun_sign} - Your Essential Nature',
-                    'content': sun_descriptions.get(sun_sign, f"Your {sun_sign} nature brings unique gifts to the world.")
+                    'content': sun_info.essence if sun_info else f"Your {sun_sign} nature brings unique gifts to the world."
                 },
                 'emotional_world': {
                     'heading': f'Your Moon in {moon_sign} - Your Emotional Nature',
@@ -192,61 +793,37 @@ class ProfessionalAstrologyEngine:
             }
         }
     
-    def interpret_career_profession(self, chart_data):
+    def interpret_career_profession(self, chart_data, signs=None):
         """Comprehensive career guidance"""
-        sun_sign = chart_data.get('sun_sign', 'Aries')
-        
-        career_paths = {
-            'Aries': "Your natural leadership and pioneering spirit excel in entrepreneurship, emergency services, competitive sports, or any field where you can be first to market. You thrive when taking charge of challenging projects and inspiring teams through decisive action.",
-            'Taurus': "Your patience and eye for quality suit careers in finance, real estate, agriculture, luxury goods, or artisanal crafts. You excel at building lasting value and creating systems others depend on for security.",
-            'Gemini': "Your communication skills and versatility shine in media, education, sales, technology, or journalism. You excel at connecting people and ideas, making complex information accessible.",
-            'Cancer': "Your nurturing abilities make you exceptional in healthcare, hospitality, real estate, counseling, or childcare. You create environments where others feel safe and supported.",
-            'Leo': "Your creativity and natural charisma suit entertainment, education, luxury retail, management, or any role where you can inspire and showcase talent.",
-            'Virgo': "Your analytical skills excel in healthcare, research, quality control, editing, or technical fields. You improve systems and solve problems with methodical precision.",
-            'Libra': "Your diplomatic skills suit law, counseling, design, mediation, or partnership-based businesses. You create harmony and find solutions that benefit everyone.",
-            'Scorpio': "Your investigative nature suits psychology, research, finance, healing arts, or transformation-focused careers. You help others navigate profound changes.",
-            'Sagittarius': "Your love of learning suits education, travel, publishing, law, or international business. You expand others' horizons through teaching and cultural exchange.",
-            'Capricorn': "Your discipline and ambition suit business leadership, government, engineering, or traditional professional fields. You build lasting institutions.",
-            'Aquarius': "Your innovative thinking suits technology, humanitarian work, research, or progressive causes. You advance society through breakthrough ideas.",
-            'Pisces': "Your creativity and compassion suit arts, healing professions, spirituality, or charitable work. You bring inspiration and emotional healing to your work."
-        }
+        signs = signs or _chart_signs(chart_data)
+        sun_sign = signs.sun
+        
+        sun_info = signs.sun_info
         
         return {
             'title': 'Career & Professional Success',
             'sections': {
                 'career_path': {
                     'heading': f'Professional Direction for {sun_sign}',
-                    'content': career_paths.get(sun_sign, f"Your {sun_sign} nature offers unique professional opportunities.")
+                    'content': sun_info.career if sun_info else f"Your {sun_sign} nature offers unique professional opportunities."
                 }
             }
         }
     
-    def interpret_relationships_love(self, chart_data):
+    def interpret_relationships_love(self, chart_data, signs=None):
         """Comprehensive relationship insights"""
-        sun_sign = chart_data.get('sun_sign', 'Aries')
-        moon_sign = chart_data.get('moon_sign', 'Cancer')
-        
-        love_styles = {
-            'Aries': "In love, you bring passion, excitement, and unwavering loyalty. You love with your whole heart and appreciate partners who can match your enthusiasm for life while respecting your need for independence.",
-            'Taurus': "You offer steady, devoted love and create beautiful, comfortable shared spaces. You show love through practical actions and prefer stable, long-term commitments over casual dating.",
-            'Gemini': "You bring playfulness and intellectual stimulation to relationships. You need mental connection as much as emotional intimacy and appreciate partners who engage with your ideas.",
-            'Cancer': "You nurture your loved ones with deep emotional care and intuitive understanding. You create a sense of home and family wherever you are, offering emotional security.",
-            'Leo': "You bring warmth, generosity, and romantic flair to relationships. You love to celebrate your partner and create memorable experiences together.",
-            'Virgo': "You show love through thoughtful actions and genuine care for your partner's wellbeing. You pay attention to details that matter and work to improve relationships.",
-            'Libra': "You bring harmony, romance, and diplomatic grace to partnerships. You naturally seek balance and work to create relationships where both feel valued.",
-            'Scorpio': "You offer intense, transformative love that goes beyond surface attraction. You seek deep emotional connection and are fiercely loyal once committed.",
-            'Sagittarius': "You bring adventure, optimism, and philosophical depth to relationships. You need freedom to explore within partnership and inspire growth.",
-            'Capricorn': "You build relationships with care and long-term vision. You show love through commitment and working toward shared goals.",
-            'Aquarius': "You bring unique perspectives and humanitarian values to relationships. You need intellectual connection and appreciate partners who share your ideals.",
-            'Pisces': "You love with boundless compassion and intuitive understanding. You bring creativity, spirituality, and emotional healing to relationships."
-        }
+        signs = signs or _chart_signs(chart_data)
+        sun_sign = signs.sun
+        moon_sign = signs.moon
+        
+        sun_info = signs.sun_info
         
         return {
             'title': 'Love & Relationships',
             'sections': {
                 'love_nature': {
                     'heading': f'Your {sun_sign} Love Style',
-                    'content': love_styles.get(sun_sign, f"Your {sun_sign} nature brings unique gifts to relationships.")
+                    'content': sun_info.love if sun_info else f"Your {sun_sign} nature brings unique gifts to relationships."
                 },
                 'emotional_needs': {
                     'heading': f'Emotional Needs ({moon_sign} Moon)',
@@ -255,83 +832,45 @@ class ProfessionalAstrologyEngine:
             }
         }
     
-    def interpret_health_vitality(self, chart_data):
+    def interpret_health_vitality(self, chart_data, signs=None):
         """Health and wellness guidance"""
-        sun_sign = chart_data.get('sun_sign', 'Aries')
-        
-        health_approaches = {
-            'Aries': "Your dynamic energy needs regular physical outlets. High-intensity exercise, competitive sports, or martial arts help you release stress. Pay attention to head-related issues and manage stress levels.",
-            'Taurus': "Your steady constitution benefits from consistent, moderate exercise and attention to nutrition. Walking, yoga, or gardening suit your nature. Watch throat and weight-related concerns.",
-            'Gemini': "Your active mind needs variety in fitness routines. Team sports, dance, or activities combining learning with movement work well. Pay attention to nervous system and respiratory health.",
-            'Cancer': "Your sensitive system benefits from gentle, nurturing approaches. Swimming, walking, or home-based routines suit you. Watch digestive and emotional eating patterns.",
-            'Leo': "Your vital energy shines when you enjoy your fitness routine. Dance, performance-based fitness, or heart-healthy activities align with your nature.",
-            'Virgo': "Your methodical approach serves you well with detailed wellness routines. Precise programs and nutrition tracking suit your systematic nature.",
-            'Libra': "Your love of beauty draws you to aesthetically pleasing fitness activities. Partner workouts or activities in beautiful settings motivate you.",
-            'Scorpio': "Your intense nature benefits from transformative, challenging routines. Intense training or healing arts suit your depth.",
-            'Sagittarius': "Your adventurous spirit thrives with outdoor activities and varied fitness experiences. Hiking or adventure sports motivate you.",
-            'Capricorn': "Your disciplined approach creates lasting wellness habits through consistent, goal-oriented routines. Structured programs suit your determination.",
-            'Aquarius': "Your innovative nature enjoys unique, technology-enhanced, or group fitness activities. Progressive approaches appeal to you.",
-            'Pisces': "Your sensitive system responds well to gentle, flowing movement and water-based activities. Swimming, yoga, or tai chi suit your nature."
-        }
+        signs = signs or _chart_signs(chart_data)
+        sun_sign = signs.sun
+        
+        sun_info = signs.sun_info
         
         return {
             'title': 'Health & Vitality',
             'sections': {
                 'wellness_approach': {
                     'heading': f'Health Approach for {sun_sign}',
-                    'content': health_approaches.get(sun_sign, f"Your {sun_sign} nature benefits from wellness approaches that align with your natural energy.")
+                    'content': sun_info.health if sun_info else f"Your {sun_sign} nature benefits from wellness approaches that align with your natural energy."
                 }
             }
         }
     
-    def interpret_finances_wealth(self, chart_data):
+    def interpret_finances_wealth(self, chart_data, signs=None):
         """Financial guidance and wealth building"""
-        sun_sign = chart_data.get('sun_sign', 'Aries')
-        
-        financial_styles = {
-            'Aries': "Your entrepreneurial spirit and calculated risk-taking can lead to significant gains. You spot opportunities quickly, though patience with long-term investments balances impulsive tendencies.",
-            'Taurus': "Your natural financial instincts and patience make you excellent at building substantial wealth over time. You appreciate quality investments and tangible assets.",
-            'Gemini': "Your versatility creates opportunities for diverse income sources. You excel at finding profitable information, though focusing on fewer investments may yield better returns.",
-            'Cancer': "Your intuitive approach and focus on security lead to emotionally satisfying financial choices. You excel at saving for family needs and long-term security.",
-            'Leo': "Your confidence can attract wealth through creative ventures and high-visibility opportunities. Balance generous spending with consistent saving.",
-            'Virgo': "Your analytical skills make you excellent at budgeting and finding undervalued opportunities. You prefer conservative, well-researched investments.",
-            'Libra': "Your diplomatic skills can create wealth through partnerships or beauty-related businesses. You appreciate balanced investment portfolios.",
-            'Scorpio': "Your strategic thinking can uncover hidden opportunities and lead to wealth transformation. You excel at long-term financial planning.",
-            'Sagittarius': "Your optimistic nature can create wealth through international or education-related ventures. Ground expansive visions with practical planning.",
-            'Capricorn': "Your disciplined approach naturally builds substantial wealth through consistent saving and strategic investments.",
-            'Aquarius': "Your innovative thinking can create wealth through technology or progressive investments aligned with your values.",
-            'Pisces': "Your intuitive nature influences financial choices toward personally meaningful investments. Balance generosity with practical money management."
-        }
+        signs = signs or _chart_signs(chart_data)
+        sun_sign = signs.sun
+        sun_info = signs.sun_info
         
         return {
             'title': 'Finances & Wealth Building',
             'sections': {
                 'money_approach': {
                     'heading': f'Financial Style for {sun_sign}',
-                    'content': financial_styles.get(sun_sign, f"Your {sun_sign} approach reflects your natural values and decision-making style.")
+                    'content': sun_info.finances if sun_info else f"Your {sun_sign} approach reflects your natural values and decision-making style."
                 }
             }
         }
     
-    def interpret_family_children(self, chart_data):
+    def interpret_family_children(self, chart_data, signs=None):
         """Family and parenting insights"""
-        moon_sign = chart_data.get('moon_sign', 'Cancer')
-        sun_sign = chart_data.get('sun_sign', 'Aries')
-        
-        parenting_styles = {
-            'Aries': "You encourage independence and courage in children, teaching them to be strong and pursue goals fearlessly.",
-            'Taurus': "You provide stability and security, teaching children patience and appreciation for life's simple pleasures.",
-            'Gemini': "You stimulate curiosity and communication, creating environments rich in learning and exploration.",
-            'Cancer': "You nurture emotional development and create deep family bonds through caring attention.",
-            'Leo': "You encourage self-expression and creativity, helping children develop confidence in their talents.",
-            'Virgo': "You teach practical skills and attention to detail, helping children develop good habits.",
-            'Libra': "You teach fairness and diplomacy, helping children appreciate beauty and harmony.",
-            'Scorpio': "You encourage emotional honesty and depth, helping children understand life's complexities.",
-            'Sagittarius': "You inspire adventure and learning, encouraging children to explore and question.",
-            'Capricorn': "You teach responsibility and goal-setting, helping children build character through achievement.",
-            'Aquarius': "You encourage individuality and social awareness, helping children think independently.",
-            'Pisces': "You nurture creativity and compassion, helping children develop emotional intelligence."
-        }
+        signs = signs or _chart_signs(chart_data)
+        moon_sign = signs.moon
+        sun_sign = signs.sun
+        sun_info = signs.sun_info
         
         return {
             'title': 'Family & Children',
@@ -342,137 +881,81 @@ class ProfessionalAstrologyEngine:
                 },
                 'parenting_style': {
                     'heading': 'Your Natural Parenting Approach',
-                    'content': parenting_styles.get(sun_sign, f"Your {sun_sign} nature shapes how you guide children.")
+                    'content': sun_info.parenting if sun_info else f"Your {sun_sign} nature shapes how you guide children."
                 }
             }
         }
     
-    def interpret_spiritual_growth(self, chart_data):
+    def interpret_spiritual_growth(self, chart_data, signs=None):
         """Spiritual development insights"""
-        sun_sign = chart_data.get('sun_sign', 'Aries')
-        
-        spiritual_paths = {
-            'Aries': "Your spiritual path involves balancing pioneering spirit with patience. You grow through leadership in spiritual communities and courageous service.",
-            'Taurus': "Your spiritual development comes through connecting with nature and finding sacred meaning in life's simple pleasures.",
-            'Gemini': "Your spiritual journey involves synthesizing diverse wisdom traditions and sharing insights through teaching or writing.",
-            'Cancer': "Your spiritual path centers on developing healing abilities and creating nurturing communities where others can grow.",
-            'Leo': "Your spiritual development involves expressing authentic self while serving something greater than personal recognition.",
-            'Virgo': "Your spiritual path involves finding perfection through humble service and attention to life's sacred details.",
-            'Libra': "Your spiritual journey involves creating harmony and justice through diplomatic service and mediation.",
-            'Scorpio': "Your spiritual path involves deep transformation and helping others heal from life's wounds.",
-            'Sagittarius': "Your spiritual development comes through exploring wisdom traditions and sharing philosophical insights.",
-            'Capricorn': "Your spiritual path involves building lasting structures for spiritual purposes through disciplined practice.",
-            'Aquarius': "Your spiritual journey involves humanitarian causes that advance consciousness for all humanity.",
-            'Pisces': "Your spiritual path is naturally mystical, involving direct divine connection and selfless service."
-        }
+        signs = signs or _chart_signs(chart_data)
+        sun_sign = signs.sun
+        sun_info = signs.sun_info
         
         return {
             'title': 'Spiritual Growth & Higher Purpose',
             'sections': {
                 'spiritual_journey': {
                     'heading': f'Your {sun_sign} Spiritual Path',
-                    'content': spiritual_paths.get(sun_sign, f"Your {sun_sign} nature suggests a unique approach to spiritual development.")
+                    'content': sun_info.spiritual if sun_info else f"Your {sun_sign} nature suggests a unique approach to spiritual development."
                 }
             }
         }
     
-    def interpret_communication_learning(self, chart_data):
+    def interpret_communication_learning(self, chart_data, signs=None):
         """Communication and learning insights"""
-        mercury_sign = chart_data['planets'].get('mercury', {}).get('sign', chart_data.get('sun_sign', 'Aries'))
-        
-        communication_styles = {
-            'Aries': "You communicate with directness and enthusiasm, preferring quick conversations. You learn best through hands-on experience and express ideas with motivating energy.",
-            'Taurus': "You communicate thoughtfully and deliberately, preferring substantial conversations. You learn through practical application and express ideas emphasizing real-world value.",
-            'Gemini': "You're a natural communicator who enjoys exploring ideas through conversation. You learn quickly through varied experiences and explain complex concepts accessibly.",
-            'Cancer': "You communicate with emotional intelligence and intuitive understanding. You learn best in supportive environments and express ideas creating connection.",
-            'Leo': "You communicate with warmth and engaging flair. You learn through creative expression and naturally explain ideas in inspiring ways.",
-            'Virgo': "You communicate with precision and helpful detail. You learn through systematic study and organize complex information usefully.",
-            'Libra': "You communicate diplomatically, always considering others' perspectives. You learn through discussion and present ideas in balanced ways.",
-            'Scorpio': "You communicate with intensity and depth, preferring meaningful conversations. You learn through investigation and express ideas revealing hidden truths.",
-            'Sagittarius': "You communicate enthusiasm for big ideas and philosophical concepts. You learn through exploration and explain concepts broadening perspectives.",
-            'Capricorn': "You communicate with authority and practical wisdom. You learn through structured study and present ideas emphasizing long-term benefits.",
-            'Aquarius': "You communicate innovative ideas challenging conventional thinking. You learn through experimentation and inspire others to consider new possibilities.",
-            'Pisces': "You communicate with empathy and intuitive understanding. You learn through immersion and explain ideas helping others feel emotional truth."
-        }
+        signs = signs or _chart_signs(chart_data)
+        mercury_sign = signs.mercury
+        mercury_info = _SIGN_INFO.get(mercury_sign)
         
         return {
             'title': 'Communication & Learning',
             'sections': {
                 'communication_style': {
                     'heading': f'Your {mercury_sign} Communication Style',
-                    'content': communication_styles.get(mercury_sign, f"Your {mercury_sign} Mercury influences how you think and share ideas.")
+                    'content': mercury_info.communication if mercury_info else f"Your {mercury_sign} Mercury influences how you think and share ideas."
                 }
             }
         }
     
-    def interpret_travel_adventure(self, chart_data):
+    def interpret_travel_adventure(self, chart_data, signs=None):
         """Travel and adventure preferences"""
-        sun_sign = chart_data.get('sun_sign', 'Aries')
-        
-        travel_styles = {
-            'Aries': "You love adventure travel that challenges you physically and mentally. You prefer independent travel where you can make spontaneous decisions.",
-            'Taurus': "You enjoy comfortable, scenic travel to beautiful destinations with good food and luxury accommodations.",
-            'Gemini': "You love variety in travel, preferring trips offering multiple experiences and learning opportunities.",
-            'Cancer': "You prefer travel that feels emotionally meaningful and connects you with family heritage or nurturing experiences.",
-            'Leo': "You enjoy glamorous travel to exciting destinations where you can experience luxury and entertainment.",
-            'Virgo': "You prefer well-organized travel with detailed itineraries and practical benefits like health retreats or educational tours.",
-            'Libra': "You love romantic or aesthetically beautiful destinations offering cultural refinement and harmonious experiences.",
-            'Scorpio': "You're drawn to transformative travel experiences offering depth and mystery like spiritual retreats or archaeological sites.",
-            'Sagittarius': "You're the natural traveler, loving international adventures that expand your philosophical understanding of different cultures.",
-            'Capricorn': "You prefer travel offering educational value and contributing to long-term goals like business or historical sites.",
-            'Aquarius': "You enjoy unique, unconventional travel experiences most people wouldn't consider, including humanitarian travel.",
-            'Pisces': "You prefer spiritual or artistic travel nourishing your soul, drawn to mystical destinations or places near water."
-        }
+        signs = signs or _chart_signs(chart_data)
+        sun_sign = signs.sun
+        sun_info = signs.sun_info
         
         return {
             'title': 'Travel & Adventure',
             'sections': {
                 'travel_preferences': {
                     'heading': f'Your {sun_sign} Travel Style',
-                    'content': travel_styles.get(sun_sign, f"Your {sun_sign} nature influences what types of travel experiences inspire you most.")
+                    'content': sun_info.travel if sun_info else f"Your {sun_sign} nature influences what types of travel experiences inspire you most."
                 }
             }
         }
     
-    def interpret_challenges_lessons(self, chart_data):
+    def interpret_challenges_lessons(self, chart_data, signs=None):
         """Life challenges and growth opportunities"""
-        sun_sign = chart_data.get('sun_sign', 'Aries')
-        
-        growth_areas = {
-            'Aries': "Your challenge is learning patience while maintaining natural leadership. Growth comes through developing diplomatic skills and understanding that true leadership serves others' highest good.",
-            'Taurus': "Your challenge is developing flexibility while maintaining stability. Growth comes through learning when to adapt and finding balance between security and necessary evolution.",
-            'Gemini': "Your challenge is developing depth while maintaining curiosity. Growth comes through choosing meaningful commitments and learning to complete projects before moving to new interests.",
-            'Cancer': "Your challenge is setting boundaries while maintaining nurturing nature. Growth comes through learning to care for yourself and recognizing when helping becomes enabling.",
-            'Leo': "Your challenge is sharing attention while maintaining confidence. Growth comes through learning that true leadership elevates others and your light shines brighter helping others discover their brilliance.",
-            'Virgo': "Your challenge is accepting imperfection while maintaining excellence. Growth comes through learning 'good enough' is often sufficient and perfectionism can prevent completing important work.",
-            'Libra': "Your challenge is making independent decisions while maintaining diplomacy. Growth comes through trusting your judgment and understanding some conflict is necessary for authentic relationships.",
-            'Scorpio': "Your challenge is learning to trust while maintaining strength. Growth comes through understanding true power includes courage to be open and healing requires both strength and gentleness.",
-            'Sagittarius': "Your challenge is developing commitment while maintaining freedom. Growth comes through learning depth enhances adventures and understanding that promises matter.",
-            'Capricorn': "Your challenge is balancing achievement with enjoyment while maintaining discipline. Growth comes through celebrating progress and understanding success includes happiness, not just accomplishment.",
-            'Aquarius': "Your challenge is connecting emotionally while maintaining objectivity. Growth comes through learning personal relationships enhance your ability to serve humanity's evolution.",
-            'Pisces': "Your challenge is developing boundaries while maintaining compassion. Growth comes through learning self-care enables you to serve others more effectively."
-        }
+        signs = signs or _chart_signs(chart_data)
+        sun_sign = signs.sun
+        sun_info = signs.sun_info
         
         return {
             'title': 'Life Challenges & Growth Opportunities',
             'sections': {
                 'growth_edge': {
                     'heading': f'Your {sun_sign} Growth Challenge',
-                    'content': growth_areas.get(sun_sign, f"Your {sun_sign} nature brings both gifts and growth opportunities.")
+                    'content': sun_info.growth if sun_info else f"Your {sun_sign} nature brings both gifts and growth opportunities."
                 }
             }
         }
     
-    # ========== YOUR EXISTING TECHNICAL METHODS (UNCHANGED) ==========
+    # ========== CHART CALCULATION METHODS ==========
     
     def _enhanced_precision_calculation(self, birth_datetime, latitude, longitude, house_system):
         """Enhanced calculations using precision engine"""
         
-        # Ensure datetime has timezone info
-        if birth_datetime.tzinfo is None:
-            birth_datetime = birth_datetime.replace(tzinfo=timezone.utc)
-        
-        # Calculate precise Julian Day
+        # Calculate precise Julian Day (naive datetimes are read as UTC)
         jd = self.enhanced_engine.precise_julian_day(birth_datetime)
         
         # Get enhanced planetary positions (tropical)
@@ -483,30 +966,26 @@ class ProfessionalAstrologyEngine:
         planets_tropical['moon'] = moon_tropical
         
         # Add outer planets with basic calculations for completeness
-        planets_tropical.update({
-            'uranus': self._calculate_planet_longitude(jd, 'uranus'),
-            'neptune': self._calculate_planet_longitude(jd, 'neptune'),
-            'pluto': self._calculate_planet_longitude(jd, 'pluto')
-        })
+        planets_tropical.update(_mean_planet_longitudes(jd))
         
         # Calculate ayanamsa and convert to sidereal
         ayanamsa_value = self.enhanced_engine.calculate_ayanamsa(jd, self.ayanamsa_system)
         
-        # Convert tropical to sidereal positions
+        # Convert tropical to sidereal positions (same as tropical_to_sidereal, ayanamsa computed once)
         enhanced_planets = {}
+        planet_names = self.PLANETS
         for planet_key, tropical_lon in planets_tropical.items():
-            sidereal_lon = self.enhanced_engine.tropical_to_sidereal(tropical_lon, jd, self.ayanamsa_system)
+            sidereal_lon = (tropical_lon - ayanamsa_value) % 360
             
-            sign_index = int(sidereal_lon // 30)
-            sign_degrees = sidereal_lon % 30
+            sign, sign_degrees = _sign_position(sidereal_lon)
             
             enhanced_planets[planet_key] = {
-                'name': self.PLANETS.get(planet_key, planet_key.title()),
+                'name': planet_names.get(planet_key) or planet_key.title(),
                 'longitude': sidereal_lon,
                 'tropical_longitude': tropical_lon,
-                'sign': self.ZODIAC_SIGNS[sign_index],
+                'sign': sign,
                 'degrees': sign_degrees,
-                'formatted': f"{sign_degrees:.1f}° {self.ZODIAC_SIGNS[sign_index]}",
+                'formatted': f"{sign_degrees:.1f}° {sign}",
                 'precision': 'enhanced'
             }
         
@@ -519,7 +998,7 @@ class ProfessionalAstrologyEngine:
         # Traditional compatibility fields
         sun_sign = enhanced_planets['sun']['sign']
         moon_sign = enhanced_planets['moon']['sign']
-        ascendant_sign = houses[0]['sign'] if houses else 'Calculating...'
+        ascendant_sign = houses[0]['sign']  # _calculate_enhanced_houses always returns 12 cusps
         
         return {
             'planets': enhanced_planets,
@@ -538,8 +1017,7 @@ class ProfessionalAstrologyEngine:
     
     def _standard_calculation(self, birth_datetime, latitude, longitude, house_system):
         """Standard calculation fallback"""
-        from astro_calc import AstrologyCalculator
-        calc = AstrologyCalculator()
+        calc = self._std_calc
         
         sun_sign = calc.get_sun_sign(birth_datetime)
         moon_sign = calc.get_moon_sign(birth_datetime)
@@ -552,43 +1030,41 @@ class ProfessionalAstrologyEngine:
         
         # Sun
         sun_lon = calc.sun_longitude(jd)
-        sun_sign_index = int(sun_lon // 30)
-        sun_degrees = sun_lon % 30
+        sun_sign, sun_degrees = _sign_position(sun_lon)
         enhanced_planets['sun'] = {
             'name': 'Sun',
             'longitude': sun_lon,
-            'sign': self.ZODIAC_SIGNS[sun_sign_index],
+            'sign': sun_sign,
             'degrees': sun_degrees,
-            'formatted': f"{sun_degrees:.1f}° {self.ZODIAC_SIGNS[sun_sign_index]}",
+            'formatted': f"{sun_degrees:.1f}° {sun_sign}",
             'precision': 'standard'
         }
         
         # Moon
         moon_lon = calc.moon_longitude(jd)
-        moon_sign_index = int(moon_lon // 30)
-        moon_degrees = moon_lon % 30
+        moon_sign, moon_degrees = _sign_position(moon_lon)
         enhanced_planets['moon'] = {
             'name': 'Moon',
             'longitude': moon_lon,
-            'sign': self.ZODIAC_SIGNS[moon_sign_index],
+            'sign': moon_sign,
             'degrees': moon_degrees,
-            'formatted': f"{moon_degrees:.1f}° {self.ZODIAC_SIGNS[moon_sign_index]}",
+            'formatted': f"{moon_degrees:.1f}° {moon_sign}",
             'precision': 'standard'
         }
         
         # Other planets
         for planet_name, sign in basic_planets.items():
-            if planet_name.lower() not in ['sun', 'moon']:
-                planet_lon = self._calculate_planet_longitude(jd, planet_name.lower())
-                planet_sign_index = int(planet_lon // 30)
-                planet_degrees = planet_lon % 30
+            planet_key = planet_name.lower()
+            if planet_key not in ['sun', 'moon']:
+                planet_lon = self._calculate_planet_longitude(jd, planet_key)
+                planet_sign, planet_degrees = _sign_position(planet_lon)
                 
-                enhanced_planets[planet_name.lower()] = {
+                enhanced_planets[planet_key] = {
                     'name': planet_name,
                     'longitude': planet_lon,
-                    'sign': self.ZODIAC_SIGNS[planet_sign_index],
+                    'sign': planet_sign,
                     'degrees': planet_degrees,
-                    'formatted': f"{planet_degrees:.1f}° {self.ZODIAC_SIGNS[planet_sign_index]}",
+                    'formatted': f"{planet_degrees:.1f}° {planet_sign}",
                     'precision': 'standard'
                 }
         
@@ -609,23 +1085,7 @@ class ProfessionalAstrologyEngine:
     
     def _calculate_planet_longitude(self, jd, planet):
         """Calculate approximate planetary longitudes"""
-        n = jd - 2451545.0
-        
-        planet_formulas = {
-            'mercury': (252.25, 4.092317),
-            'venus': (181.98, 1.602129),
-            'mars': (355.43, 0.524071),
-            'jupiter': (34.35, 0.083091),
-            'saturn': (50.08, 0.033494),
-            'uranus': (313.23, 0.011773),
-            'neptune': (304.35, 0.006027),
-            'pluto': (238.92, 0.003968)
-        }
-        
-        if planet in planet_formulas:
-            base, rate = planet_formulas[planet]
-            return (base + rate * n) % 360
-        return 0.0
+        return _mean_planet_longitude(jd, planet)
     
     def _calculate_enhanced_houses(self, birth_datetime, latitude, longitude, system, jd=None, ayanamsa_value=None):
         """Calculate house cusps with enhanced precision"""
@@ -633,40 +1093,21 @@ class ProfessionalAstrologyEngine:
         
         # Use enhanced Julian Day if available, otherwise calculate
         if jd is None:
-            from astro_calc import AstrologyCalculator
-            calc = AstrologyCalculator()
+            calc = self._std_calc
             jd = calc.julian_day(birth_datetime)
         
-        # Calculate Local Sidereal Time with higher precision
-        T = (jd - 2451545.0) / 36525.0
-        theta0 = 280.46061837 + 360.98564736629 * (jd - 2451545.0) + 0.000387933 * T**2 - T**3 / 38710000.0
-        lst_degrees = (theta0 + longitude) % 360
+        lst_degrees = _local_sidereal_degrees(jd, longitude)
+        cusps = _house_cusp_longitudes(lst_degrees, latitude, system, ayanamsa_value)
         
-        # Enhanced house calculation
-        for i in range(12):
-            if system == 'equal':
-                house_longitude = (lst_degrees + i * 30) % 360
-            elif system == 'whole':
-                ascendant_sign = int(lst_degrees // 30)
-                house_longitude = ((ascendant_sign + i) % 12) * 30
-            else:  # Placidus approximation with latitude correction
-                base_longitude = (i * 30 + lst_degrees) % 360
-                lat_correction = math.sin(math.radians(latitude)) * 3 * math.cos(math.radians(base_longitude))
-                house_longitude = (base_longitude + lat_correction) % 360
-            
-            # Apply ayanamsa correction if available (for sidereal houses)
-            if ayanamsa_value is not None:
-                house_longitude = (house_longitude - ayanamsa_value) % 360
-            
-            sign_index = int(house_longitude // 30)
-            sign_degrees = house_longitude % 30
+        for i, house_longitude in enumerate(cusps):
+            sign, sign_degrees = _sign_position(house_longitude)
             
             houses.append({
                 'house': i + 1,
                 'longitude': house_longitude,
-                'sign': self.ZODIAC_SIGNS[sign_index],
+                'sign': sign,
                 'degrees': sign_degrees,
-                'formatted': f"House {i + 1}: {sign_degrees:.1f}° {self.ZODIAC_SIGNS[sign_index]}"
+                'formatted': f"House {i + 1}: {sign_degrees:.1f}° {sign}"
             })
         
         return houses
@@ -674,82 +1115,45 @@ class ProfessionalAstrologyEngine:
     def _calculate_precise_aspects(self, planetary_data):
         """Calculate aspects with enhanced precision"""
         aspects = []
-        major_aspects = {
-            'conjunction': (0, 6),      
-            'opposition': (180, 6),     
-            'trine': (120, 5),          
-            'square': (90, 5),          
-            'sextile': (60, 3),         
-        }
-        
-        planet_list = list(planetary_data.keys())
+        planets = planetary_data.values()
+        longitudes = [planet.get('longitude') for planet in planets]
+        names = [planet.get('name') for planet in planets]
+        precision = 'enhanced' if self.precision_mode == 'ENHANCED' else 'standard'
         
-        for i, planet1 in enumerate(planet_list):
-            for planet2 in planet_list[i+1:]:
-                if 'longitude' not in planetary_data[planet1] or 'longitude' not in planetary_data[planet2]:
-                    continue
-                
-                p1_lon = planetary_data[planet1]['longitude']
-                p2_lon = planetary_data[planet2]['longitude']
-                
-                # Calculate angular separation with higher precision
-                separation = abs(p1_lon - p2_lon)
-                if separation > 180:
-                    separation = 360 - separation
-                
-                # Check for major aspects with tighter orbs
-                for aspect_name, (exact_angle, orb) in major_aspects.items():
-                    orb_difference = abs(separation - exact_angle)
-                    if orb_difference <= orb:
-                        strength = 'exact' if orb_difference < 1 else 'close' if orb_difference < 3 else 'wide'
-                        
-                        aspects.append({
-                            'planet1': planetary_data[planet1]['name'],
-                            'planet2': planetary_data[planet2]['name'],
-                            'aspect': aspect_name,
-                            'orb': orb_difference,
-                            'strength': strength,
-                            'description': f"{planetary_data[planet1]['name']} {aspect_name} {planetary_data[planet2]['name']}",
-                            'precision': 'enhanced' if self.precision_mode == 'ENHANCED' else 'standard'
-                        })
+        # Check for major aspects with tighter orbs
+        for i, j, aspect_name, orb_difference in _aspect_hits(longitudes, _PRECISE_ASPECT_WINDOWS):
+            name1 = names[i]
+            name2 = names[j]
+            aspects.append({
+                'planet1': name1,
+                'planet2': name2,
+                'aspect': aspect_name,
+                'orb': orb_difference,
+                'strength': _ASPECT_STRENGTHS[bisect.bisect_right(_ASPECT_STRENGTH_BOUNDS, orb_difference)],
+                'description': f"{name1} {aspect_name} {name2}",
+                'precision': precision
+            })
         
         return aspects
     
     def _calculate_aspects(self, planetary_data):
         """Standard aspect calculation for fallback"""
         aspects = []
-        major_aspects = {
-            'conjunction': (0, 8),      
-            'opposition': (180, 8),     
-            'trine': (120, 6),          
-            'square': (90, 6),          
-            'sextile': (60, 4),         
-        }
-        
-        planet_list = list(planetary_data.keys())
+        planets = planetary_data.values()
+        longitudes = [planet.get('longitude') for planet in planets]
+        names = [planet.get('name') for planet in planets]
         
-        for i, planet1 in enumerate(planet_list):
-            for planet2 in planet_list[i+1:]:
-                if 'longitude' not in planetary_data[planet1] or 'longitude' not in planetary_data[planet2]:
-                    continue
-                
-                p1_lon = planetary_data[planet1]['longitude']
-                p2_lon = planetary_data[planet2]['longitude']
-                
-                separation = abs(p1_lon - p2_lon)
-                if separation > 180:
-                    separation = 360 - separation
-                
-                for aspect_name, (exact_angle, orb) in major_aspects.items():
-                    if abs(separation - exact_angle) <= orb:
-                        aspects.append({
-                            'planet1': planetary_data[planet1]['name'],
-                            'planet2': planetary_data[planet2]['name'],
-                            'aspect': aspect_name,
-                            'orb': abs(separation - exact_angle),
-                            'description': f"{planetary_data[planet1]['name']} {aspect_name} {planetary_data[planet2]['name']}",
-                            'precision': 'standard'
-                        })
+        for i, j, aspect_name, orb_difference in _aspect_hits(longitudes, _STANDARD_ASPECT_WINDOWS):
+            name1 = names[i]
+            name2 = names[j]
+            aspects.append({
+                'planet1': name1,
+                'planet2': name2,
+                'aspect': aspect_name,
+                'orb': orb_difference,
+                'description': f"{name1} {aspect_name} {name2}",
+                'precision': 'standard'
+            })
         
         return aspects
     
@@ -759,25 +1163,16 @@ class ProfessionalAstrologyEngine:
         
         try:
             if self.precision_mode == 'ENHANCED' and birth_chart.get('julian_day'):
-                # Use enhanced engine for precise transits
-                current_jd = self.enhanced_engine.precise_julian_day(prediction_date.replace(tzinfo=timezone.utc))
-                
-                # Calculate current planetary positions
-                current_sun = self.enhanced_engine.enhanced_sun_longitude(current_jd)
-                current_moon = self.enhanced_engine.enhanced_moon_longitude(current_jd)
-                
-                # Convert to sidereal
-                current_sun_sidereal = self.enhanced_engine.tropical_to_sidereal(current_sun, current_jd, self.ayanamsa_system)
-                current_moon_sidereal = self.enhanced_engine.tropical_to_sidereal(current_moon, current_jd, self.ayanamsa_system)
-                
-                sun_sign = self.ZODIAC_SIGNS[int(current_sun_sidereal // 30)]
-                moon_sign = self.ZODIAC_SIGNS[int(current_moon_sidereal // 30)]
+                # Use enhanced engine for precise transits, evaluated at the start of the minute
+                sun_sign, moon_sign = _enhanced_transit_signs(
+                    self.ayanamsa_system, prediction_date.replace(second=0, microsecond=0, tzinfo=None))
+                sun_theme = sun_sign.lower()  # used twice in the solar text
                 
                 predictions.extend([
                     {
                         'type': 'solar',
                         'description': f"Solar Energy in {sun_sign}",
-                        'interpretation': f"The Sun in {sun_sign} brings opportunities for growth in {sun_sign.lower()} themes. This is an excellent time to focus on developing your {sun_sign.lower()} qualities and pursuing related goals.",
+                        'interpretation': f"The Sun in {sun_sign} brings opportunities for growth in {sun_theme} themes. This is an excellent time to focus on developing your {sun_theme} qualities and pursuing related goals.",
                         'strength': 'strong',
                         'precision': 'enhanced'
                     },
@@ -792,8 +1187,7 @@ class ProfessionalAstrologyEngine:
                 
             else:
                 # Fallback to standard calculations
-                from astro_calc import AstrologyCalculator
-                calc = AstrologyCalculator()
+                calc = self._std_calc
                 
                 current_sun_sign = calc.get_sun_sign(prediction_date)
                 current_moon_sign = calc.get_moon_sign(prediction_date)
@@ -824,3 +1218,91 @@ class ProfessionalAstrologyEngine:
             })
         
         return predictions
+
+
+class ChartBatch:
+    """
+    Column-oriented longitudes for many charts, for synastry and bulk scans
+    
+    planet_longitudes is a flat array of len(self) x len(PLANET_KEYS)
+    doubles in PLANET_KEYS order, house_cusps is len(self) x 12; a planet
+    missing from a chart is stored as NaN. Sign lookups work on these
+    columns directly, so no per-planet dicts are touched until to_dicts().
+    """
+    
+    PLANET_KEYS = tuple(ProfessionalAstrologyEngine.PLANETS)
+    ZODIAC_SIGNS = tuple(ProfessionalAstrologyEngine.ZODIAC_SIGNS)
+    _PLANET_COLUMNS = {key: column for column, key in enumerate(PLANET_KEYS)}
+    
+    def __init__(self, planet_longitudes, house_cusps):
+        self.planet_longitudes = planet_longitudes
+        self.house_cusps = house_cusps
+    
+    @classmethod
+    def from_charts(cls, charts):
+        """Build a batch from calculate_professional_chart results"""
+        nan = math.nan
+        planet_longitudes = array('d')
+        house_cusps = array('d')
+        for chart in charts:
+            planets = chart['planets']
+            for key in cls.PLANET_KEYS:
+                planet = planets.get(key)
+                planet_longitudes.append(planet['longitude'] if planet else nan)
+            house_cusps.extend([house['longitude'] for house in chart['houses']])
+        return cls(planet_longitudes, house_cusps)
+    
+    def __len__(self):
+        return len(self.planet_longitudes) // len(self.PLANET_KEYS)
+    
+    def planet_column(self, planet_key):
+        """Longitudes of one planet across all charts"""
+        return self.planet_longitudes[self._PLANET_COLUMNS[planet_key]::len(self.PLANET_KEYS)]
+    
+    def sign_indices(self, longitudes):
+        """Sign index (0-11) per longitude, None for a missing planet"""
+        return [int(lon // 30.0) % 12 if lon == lon else None for lon in longitudes]
+    
+    def planet_signs(self, planet_key):
+        """Sign name of one planet across all charts"""
+        signs = self.ZODIAC_SIGNS
+        return [signs[i] if i is not None else None
+                for i in self.sign_indices(self.planet_column(planet_key))]
+    
+    def to_dicts(self):
+        """Per-chart {'planets': {key: {longitude, sign}}, 'houses': [...]} at the API boundary"""
+        keys = self.PLANET_KEYS
+        signs = self.ZODIAC_SIGNS
+        width = len(keys)
+        planet_signs = self.sign_indices(self.planet_longitudes)
+        house_signs = self.sign_indices(self.house_cusps)
+        charts = []
+        for row in range(len(self)):
+            base = row * width
+            planets = {}
+            for col, key in enumerate(keys):
+                sign_index = planet_signs[base + col]
+                if sign_index is not None:
+                    planets[key] = {'longitude': self.planet_longitudes[base + col],
+                                    'sign': signs[sign_index]}
+            houses = [{'house': i + 1, 'longitude': self.house_cusps[row * 12 + i],
+                       'sign': signs[house_signs[row * 12 + i]]} for i in range(12)]
+            charts.append({'planets': planets, 'houses': houses})
+        return charts
+
+
+@functools.lru_cache(maxsize=1024)
+def _enhanced_transit_signs(ayanamsa_system, minute):
+    """Sidereal (sun sign, moon sign) at a naive datetime read as UTC"""
+    engine = ProfessionalAstrologyEngine._get_enhanced_engine(ayanamsa_system)
+    current_jd = engine.precise_julian_day(minute)
+    
+    # Calculate current planetary positions
+    current_sun = engine.enhanced_sun_longitude(current_jd)
+    current_moon = engine.enhanced_moon_longitude(current_jd)
+    
+    # Convert to sidereal
+    current_sun_sidereal = engine.tropical_to_sidereal(current_sun, current_jd, ayanamsa_system)
+    current_moon_sidereal = engine.tropical_to_sidereal(current_moon, current_jd, ayanamsa_system)
+    
+    return _sign_position(current_sun_sidereal)[0], _sign_position(current_moon_sidereal)[0]
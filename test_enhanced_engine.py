@@ -3,8 +3,19 @@ Test the Enhanced Base Engine
 Run this to verify our enhancements work
 """
 
+import json
+import math
+import random
+from unittest import mock
+import geocoding
+import professional_astro
+from astro_calc import AstrologyCalculator
 from engines.base_engine import EnhancedBaseEngine
-from datetime import datetime, timezone
+from engines.rectification import birth_time_rectifier
+from engines.rectification.birth_time_rectifier import (
+    BirthTimeRectifier, _CandidateScores, RESULT_COUNT, MEMO_CACHE_SIZE
+)
+from datetime import datetime, timezone, timedelta
 
 def test_enhanced_calculations():
     """Test the enhanced calculation methods"""
@@ -61,6 +72,337 @@ def test_enhanced_calculations():
         print(f"❌ Error in enhanced calculations: {e}")
         return False
 
+def _random_rectification_job(rng):
+    """Birth data and life events for one random rectification job"""
+    birth_date = datetime(rng.randint(1950, 2005), rng.randint(1, 12), rng.randint(1, 28))
+    birth_data = {
+        'date': birth_date.strftime('%Y-%m-%d'),
+        'approximate_time': f"{rng.randint(0, 23):02d}:{rng.choice([0, 15, 30, 45]):02d}",
+        'latitude': rng.uniform(-50, 60),
+        'longitude': rng.uniform(-120, 150),
+        'personality': {trait: rng.random() < 0.6 for trait in
+                        rng.sample(['energetic', 'stable', 'curious', 'emotional', 'creative',
+                                    'analytical', 'social', 'intense', 'serious', 'dreamy'], 4)},
+    }
+    event_types = ['marriage', 'career', 'education', 'health', 'travel', 'children']
+    life_events = [
+        {'date': (birth_date + timedelta(days=rng.randint(5000, 20000))).strftime('%Y-%m-%d'),
+         'type': rng.choice(event_types), 'importance': round(rng.random(), 2)}
+        for _ in range(rng.randint(3, 5))
+    ]
+    return birth_data, life_events
+
+def _exhaustive_best_score(rectifier, birth_data, life_events, time_window_hours=4):
+    """Best composite score of a full 2-minute scan of the window"""
+    approx = datetime.strptime(f"{birth_data['date']} {birth_data['approximate_time']}", '%Y-%m-%d %H:%M')
+    candidates = _CandidateScores()
+    for candidate_time in rectifier._generate_time_candidates(approx, time_window_hours):
+        rectifier._add_candidate(candidates, candidate_time, birth_data['latitude'],
+                                 birth_data['longitude'], life_events, birth_data['personality'])
+    return candidates.composite_scores[candidates.top_rows(RESULT_COUNT)[0]]
+
+def test_rectification_matches_exhaustive_scan():
+    """Coarse-to-fine search finds the best score of the full 2-minute scan"""
+    rectifier = BirthTimeRectifier(EnhancedBaseEngine({'enable_logging': False}))
+    rng = random.Random(20240611)
+    for _ in range(40):
+        birth_data, life_events = _random_rectification_job(rng)
+        result = rectifier.rectify_birth_time(birth_data, life_events)
+        expected = _exhaustive_best_score(rectifier, birth_data, life_events)
+        assert abs(result['confidence_score'] - expected) < 1e-9, (birth_data, life_events)
+
+def test_rectification_with_negative_ayanamsa():
+    """Before 285 AD the Lahiri ayanamsa is negative; sidereal longitudes must still wrap below 360"""
+    rectifier = BirthTimeRectifier(EnhancedBaseEngine({'enable_logging': False}))
+    birth_data = {'date': '0100-03-26', 'approximate_time': '21:20', 'latitude': 41.9, 'longitude': 12.5}
+    life_events = [{'date': '0125-06-01', 'type': 'marriage'},
+                   {'date': '0130-01-01', 'type': 'career'},
+                   {'date': '0140-01-01', 'type': 'health'}]
+    assert rectifier._lahiri_ayanamsa(1757670.5) < 0
+    result = rectifier.rectify_birth_time(birth_data, life_events)
+    assert result['success']
+    assert all(0 <= lon < 360 for lon in result['chart']['planets_sidereal'].values())
+
+def test_rectification_batch_matches_single_jobs():
+    """Batch results equal per-job results, and the shared memos stay bounded"""
+    engine = EnhancedBaseEngine({'enable_logging': False})
+    rng = random.Random(7)
+    jobs = [_random_rectification_job(rng) for _ in range(6)]
+    birth_data_list = [birth_data for birth_data, _ in jobs]
+    life_events_list = [life_events for _, life_events in jobs]
+    
+    batch_rectifier = BirthTimeRectifier(engine)
+    batch = batch_rectifier.rectify_birth_time_batch(birth_data_list, life_events_list)
+    single = [BirthTimeRectifier(engine).rectify_birth_time(birth_data, life_events)
+              for birth_data, life_events in jobs]
+    assert batch == single
+    
+    for memo in (batch_rectifier._ayanamsa_by_day, batch_rectifier._event_jd_by_date,
+                 batch_rectifier._transits_by_jd):
+        assert 0 < len(memo) <= MEMO_CACHE_SIZE
+    
+    # Evicting on every lookup must not change the results
+    small_rectifier = BirthTimeRectifier(engine)
+    with mock.patch.object(birth_time_rectifier, 'MEMO_CACHE_SIZE', 2):
+        assert small_rectifier.rectify_birth_time_batch(birth_data_list, life_events_list) == single
+    assert len(small_rectifier._transits_by_jd) <= 2
+
+class _FakeNominatimResponse:
+    status_code = 200
+    
+    def __init__(self, content):
+        self.content = content
+    
+    def json(self):
+        return json.loads(self.content)
+
+class _FakeNominatimSession:
+    """Stands in for requests.Session, answering every query with one canned body"""
+    
+    def __init__(self, content):
+        self.content = content
+        self.queries = []
+    
+    def get(self, url, params=None, timeout=None):
+        self.queries.append(params['q'])
+        return _FakeNominatimResponse(self.content)
+
+def test_geocode_misses_are_cached(tmp_path):
+    """A name Nominatim does not know is only asked about once per TTL; hits are shared"""
+    session = _FakeNominatimSession(b'[]')
+    with mock.patch.object(geocoding, '_GEOCODE_DB_PATH', str(tmp_path / 'geocode.db')), \
+         mock.patch.object(geocoding, '_nominatim_session', lambda: session), \
+         mock.patch.object(geocoding, '_NOMINATIM_MIN_INTERVAL', 0.0):
+        geocoding.geocode_city.cache_clear()
+        for _ in range(2):
+            try:
+                geocoding.geocode_city('atlantis')
+            except LookupError:
+                pass
+            else:
+                raise AssertionError('expected LookupError')
+        assert session.queries == ['atlantis']
+        
+        session.content = b'[{"lat": "48.85", "lon": "2.35", "display_name": "Paris, France"}]'
+        assert geocoding.geocode_city('paris') == (48.85, 2.35, 'Paris, France')
+        geocoding.geocode_city.cache_clear()
+        assert geocoding.geocode_city('paris') == (48.85, 2.35, 'Paris, France')
+        assert session.queries == ['atlantis', 'paris']
+        
+        # The basic calculator goes through the same cached lookup
+        assert AstrologyCalculator().get_coordinates_for_city('Paris') == (48.85, 2.35, 'Paris, France')
+        assert session.queries == ['atlantis', 'paris']
+    geocoding.geocode_city.cache_clear()
+
+def _batch_requests(count):
+    """Distinct calculate_professional_chart argument tuples"""
+    base = datetime(1985, 3, 14, 6, 0)
+    return [(base + timedelta(hours=7 * i), 40.0 + (i % 20) * 0.5, -74.0 + (i % 30), 'placidus')
+            for i in range(count)]
+
+def test_chart_batch_matches_single_charts():
+    """Batch results equal per-chart results in input order, cached or not"""
+    engine = professional_astro.ProfessionalAstrologyEngine()
+    requests_list = _batch_requests(12)
+    
+    engine._chart_cache.clear()
+    single = [engine.calculate_professional_chart(*request) for request in requests_list[::2]]
+    batch = engine.calculate_professional_charts_batch(requests_list)
+    assert batch[::2] == single
+    
+    engine._chart_cache.clear()
+    assert batch == [engine.calculate_professional_chart(*request) for request in requests_list]
+
+def test_mutating_a_chart_does_not_leak_into_cache():
+    """Charts handed out on cache hits and misses are the caller's own"""
+    engine = professional_astro.ProfessionalAstrologyEngine()
+    birth = datetime(1991, 7, 2, 9, 30)
+    engine._chart_cache.clear()
+    
+    first = engine.calculate_professional_chart(birth, 51.5, -0.1)
+    expected = json.loads(json.dumps(first))
+    first['planets']['sun']['longitude'] = -1.0
+    first['houses'][0]['sign'] = 'Nowhere'
+    report = first['comprehensive_interpretations']
+    report['personality_core']['title'] = 'Changed'
+    report.pop('career_profession')
+    
+    # Same chart from the chart cache, and a minute later with the same signs
+    again = engine.calculate_professional_chart(birth, 51.5, -0.1)
+    assert again == expected
+    again['comprehensive_interpretations']['health_vitality'].clear()
+    later = engine.calculate_professional_chart(birth + timedelta(minutes=1), 51.5, -0.1)
+    assert later['comprehensive_interpretations'] == expected['comprehensive_interpretations']
+
+def test_calculate_batch_route():
+    """POST /api/calculate-batch validates entries and keeps input order"""
+    from app import app, MAX_BATCH_CITIES
+    client = app.test_client()
+    
+    def post(entries):
+        return client.post('/api/calculate-batch', json={'charts': entries})
+    
+    with mock.patch.object(professional_astro, 'geocode_city', side_effect=LookupError):
+        response = post([{'birthDate': '1990-01-01', 'birthTime': '10:00', 'birthPlace': 'London'},
+                         {'birthDate': '1990-01-01', 'birthPlace': 'London'}])
+        assert response.status_code == 400
+        assert response.get_json()['error'].startswith('charts[1]:')
+        
+        response = post([{'birth_date': '1990-01-01', 'birth_time': '10:00', 'lat': 95, 'lon': 0}])
+        assert response.status_code == 400
+        assert response.get_json()['error'].startswith('charts[0]:')
+        
+        response = post([{'birthDate': '1990-01-01', 'birthTime': '10:00', 'lat': 10, 'lon': 10},
+                         {'birthDate': '1990-01-01', 'birthTime': '10:00', 'birthPlace': 'Qqzzyx'}])
+        assert response.status_code == 400
+        assert response.get_json()['error'].startswith('charts[1]: could not geocode')
+        
+        response = post([{'birthDate': '1990-01-01', 'birthTime': '10:00', 'birthPlace': f'Town {i}'}
+                         for i in range(MAX_BATCH_CITIES + 1)])
+        assert response.status_code == 400
+        
+        entries = [
+            {'birthDate': '1990-01-01', 'birthTime': '10:00', 'birthPlace': 'London'},
+            {'birth_date': '1975-06-15', 'birth_time': '23:45:30', 'latitude': -33.87, 'longitude': 151.21},
+            {'birthDate': '2001-09-30', 'birthTime': '04:05', 'birthPlace': 'London', 'houseSystem': 'whole'},
+        ]
+        response = post(entries)
+    assert response.status_code == 200
+    charts = json.loads(response.data)['charts']
+    assert [chart['birth_time'] for chart in charts] == ['10:00', '23:45:30', '04:05']
+    assert [chart['coordinates'] for chart in charts] == ['51.5074, -0.1278', '-33.8700, 151.2100',
+                                                          '51.5074, -0.1278']
+    assert charts[2]['house_system'] == 'whole'
+    
+    expected = professional_astro.ProfessionalAstrologyEngine().calculate_professional_chart(
+        datetime(1975, 6, 15, 23, 45, 30), -33.87, 151.21, 'placidus')
+    assert charts[1]['planets'] == json.loads(json.dumps(expected['planets']))
+
+def test_chart_batch_columns_and_round_trip():
+    """ChartBatch stores NaN for missing planets and to_dicts() gives the charts back"""
+    engine = professional_astro.ProfessionalAstrologyEngine()
+    charts = [engine.calculate_professional_chart(*request) for request in _batch_requests(3)]
+    charts[1]['planets'].pop('pluto')
+    batch = professional_astro.ChartBatch.from_charts(charts)
+    
+    assert len(batch) == 3
+    pluto = batch.planet_column('pluto')
+    assert pluto[1] != pluto[1] and pluto[0] == charts[0]['planets']['pluto']['longitude']
+    assert batch.planet_signs('pluto')[1] is None
+    assert batch.planet_signs('sun') == [chart['planets']['sun']['sign'] for chart in charts]
+    
+    for chart, row in zip(charts, batch.to_dicts()):
+        assert row['planets'] == {key: {'longitude': planet['longitude'], 'sign': planet['sign']}
+                                  for key, planet in chart['planets'].items()}
+        assert row['houses'] == [{'house': house['house'], 'longitude': house['longitude'],
+                                  'sign': house['sign']} for house in chart['houses']]
+
+def test_gazetteer_skips_bad_rows_and_matches_leading_words(tmp_path):
+    """Malformed rows are skipped, and qualified or accented names find their city"""
+    def row(name, ascii_name, lat, lon, country, population):
+        fields = [''] * 19
+        fields[1], fields[2], fields[4], fields[5] = name, ascii_name, lat, lon
+        fields[8], fields[14] = country, population
+        return '\t'.join(fields) + '\n'
+    
+    path = tmp_path / 'cities.txt'
+    path.write_text(row('Paris', 'Paris', '48.85341', '2.3488', 'FR', '2138551') +
+                    row('Paris', 'Paris', '33.66094', '-95.55551', 'US', '24782') +
+                    'not a gazetteer row\n' +
+                    row('Broken', 'Broken', 'north', '2.0', 'XX', '1') +
+                    row('São Paulo', 'Sao Paulo', '-23.5475', '-46.63611', 'BR', '10021295'),
+                    encoding='utf-8')
+    
+    with mock.patch.object(professional_astro, '_GAZETTEER_PATH', str(path)), \
+         mock.patch.object(professional_astro, '_gazetteer', None):
+        assert professional_astro._gazetteer_lookup('Paris, France') == (48.85341, 2.3488, 'Paris, FR')
+        assert professional_astro._gazetteer_lookup('  SAO PAULO ') == (-23.5475, -46.63611, 'São Paulo, BR')
+        assert professional_astro._gazetteer_lookup('São Paulo, Brazil')[2] == 'São Paulo, BR'
+        assert professional_astro._gazetteer_lookup('Broken') is None
+        assert professional_astro._gazetteer_lookup('Atlantis') is None
+
+def test_get_coordinates_for_cities_resolves_each_name_once():
+    """Duplicate city names are looked up once and all map to the same result"""
+    engine = professional_astro.ProfessionalAstrologyEngine()
+    with mock.patch.object(professional_astro.ProfessionalAstrologyEngine, 'get_coordinates_for_city',
+                           side_effect=lambda city: (1.0, 2.0, city)) as lookup:
+        cities = engine.get_coordinates_for_cities(['Paris', 'Lima', 'Paris', 'Paris'])
+    assert [call.args[0] for call in lookup.call_args_list] == ['Paris', 'Lima']
+    assert cities == {'Paris': (1.0, 2.0, 'Paris'), 'Lima': (1.0, 2.0, 'Lima')}
+
+def test_interpretation_options():
+    """include_interpretations=False drops the report; interpretation_sections narrows it"""
+    engine = professional_astro.ProfessionalAstrologyEngine()
+    birth = datetime(1988, 11, 20, 17, 15)
+    
+    bare = engine.calculate_professional_chart(birth, 35.7, 139.7, include_interpretations=False)
+    assert 'comprehensive_interpretations' not in bare
+    assert bare['planets']
+    
+    narrow = engine.calculate_professional_chart(birth, 35.7, 139.7,
+                                                 interpretation_sections=['career_profession'])
+    full = engine.calculate_professional_chart(birth, 35.7, 139.7)
+    assert list(narrow['comprehensive_interpretations']) == ['career_profession']
+    assert (narrow['comprehensive_interpretations']['career_profession'] ==
+            full['comprehensive_interpretations']['career_profession'])
+    
+    try:
+        engine.calculate_professional_chart(birth, 35.7, 139.7, interpretation_sections=['horoscope'])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('expected ValueError')
+
+def test_to_json_matches_with_and_without_orjson():
+    """to_json output parses back to the same data on either path; plain charts match byte for byte"""
+    import precision_validation
+    engine = professional_astro.ProfessionalAstrologyEngine()
+    validator = precision_validation.PrecisionValidationFramework()
+    chart = engine.calculate_professional_chart(datetime(1979, 2, 8, 3, 20), -23.55, -46.63)
+    chart['birth_location'] = 'São Paulo, Brasil'
+    payload = {'ok': True, 'charts': [chart], 'generated': datetime(2024, 1, 1, 12, 0)}
+    report = {'overall_score': 83.3, 'status': 'FAIR', 'notes': ['Zürich ✓']}
+    special = {'nan': math.nan, 'limits': (math.inf, -math.inf), 'tiny': 1e-7, 'huge': 1e16,
+               'nested': [{'orb': math.nan, 'exact': 0.0}]}
+    special_parsed = {'nan': None, 'limits': [None, None], 'tiny': 1e-7, 'huge': 1e16,
+                      'nested': [{'orb': None, 'exact': 0.0}]}
+    
+    with mock.patch.object(professional_astro, 'ORJSON_AVAILABLE', False), \
+         mock.patch.object(precision_validation, 'ORJSON_AVAILABLE', False):
+        fallback = engine.to_json(payload)
+        fallback_report = validator.to_json(report)
+        fallback_special = engine.to_json(special)
+    parsed = json.loads(fallback)
+    assert parsed['charts'][0] == json.loads(json.dumps(chart))
+    assert parsed['generated'] == '2024-01-01 12:00:00'
+    assert json.loads(fallback_report) == report
+    assert json.loads(fallback_special) == special_parsed
+    assert math.isnan(special['nan'])  # the caller's data is left alone
+    
+    if professional_astro.ORJSON_AVAILABLE:
+        assert engine.to_json(payload) == fallback
+        assert json.loads(engine.to_json(special)) == special_parsed
+    if precision_validation.ORJSON_AVAILABLE:
+        assert validator.to_json(report) == fallback_report
+
+def test_benchmark_data_is_shared_read_only():
+    """No validator can edit the shared benchmark cases; replacing them takes effect"""
+    import precision_validation
+    validator = precision_validation.PrecisionValidationFramework()
+    for edit in (lambda: validator.benchmark_data['basic_tests'].append({}),
+                 lambda: validator.benchmark_data['basic_tests'][0]['location'].update(lat=5.0)):
+        try:
+            edit()
+        except (AttributeError, TypeError):
+            pass
+        else:
+            raise AssertionError('benchmark data should be read-only')
+    
+    case = dict(precision_validation._BENCHMARK_DATA['basic_tests'][0], name='Only case')
+    validator.benchmark_data = {'basic_tests': [case]}
+    report = validator.validate_planetary_calculations()
+    assert [test['name'] for test in report['tests']] == ['Only case']
+
 if __name__ == "__main__":
     success = test_enhanced_calculations()
     if success: